@@ -60,13 +60,23 @@ MQTT_MSG_SZ_LIM = const(10000000)
 MQTT_TOPIC_LENGTH_LIMIT = const(65535)
 MQTT_TCP_PORT = const(1883)
 MQTT_TLS_PORT = const(8883)
+MQTT_RX_AHEAD_SZ = const(4096)
+MQTT_TX_PKT_SZ = const(512)
+MQTT_TOPIC_CACHE_SZ = const(32)
+
+# Variable CONNECT header template [MQTT 3.1.2]
+MQTT_HDR_CONNECT = b"\x00\x04MQTT\x04\x02\0\0"
 
 # MQTT Commands
 MQTT_PINGREQ = b"\xc0\0"
 MQTT_PINGRESP = const(0xD0)
+MQTT_CONNACK = const(0x20)
 MQTT_PUBLISH = const(0x30)
+MQTT_PUBACK = const(0x40)
 MQTT_SUB = const(0x82)
+MQTT_SUBACK = const(0x90)
 MQTT_UNSUB = const(0xA2)
+MQTT_UNSUBACK = const(0xB0)
 MQTT_DISCONNECT = b"\xe0\0"
 
 MQTT_PKT_TYPE_MASK = const(0xF0)
@@ -86,9 +96,6 @@ CONNACK_ERRORS = {
     CONNACK_ERROR_UNAUTHORIZED: "Connection Refused - Unauthorized",
 }
 
-_default_sock = None
-_fake_context = None
-
 
 class MMQTTException(Exception):
     """MiniMQTT Exception class."""
@@ -132,6 +139,9 @@ class MQTT:
         This works with all callbacks but the "on_message" and those added via add_topic_callback();
         for those, to get access to the user_data use the 'user_data' member of the MQTT object
         passed as 1st argument.
+    :param int recv_buffer_size: Size of the buffer incoming packets are read ahead into,
+        in bytes, with CPython sockets. Packets larger than this are still received.
+        Defaults to MQTT_RX_AHEAD_SZ, ``0`` disables reading ahead.
 
     """
 
@@ -152,12 +162,29 @@ class MQTT:
         socket_timeout: int = 1,
         connect_retries: int = 5,
         user_data=None,
+        recv_buffer_size: int = MQTT_RX_AHEAD_SZ,
     ) -> None:
         self._connection_manager = get_connection_manager(socket_pool)
         self._socket_pool = socket_pool
         self._ssl_context = ssl_context
         self._sock = None
         self._backwards_compatible_sock = False
+        # Reusable buffer for assembling PUBLISH headers.
+        self._tx_buf = bytearray(64)
+        # Reusable buffers for the fixed size fields of incoming packets.
+        self._rx_byte = bytearray(1)
+        self._rx_word = bytearray(2)
+        # Reusable buffer for fields parsed right after they are read, see _rx_view().
+        self._rx_buf = bytearray(64)
+        # Read-ahead buffer, only used with CPython sockets, see _buffered_recv().
+        self._rx_ahead = None
+        self._rx_start = 0
+        self._rx_end = 0
+        if recv_buffer_size < 0:
+            raise MMQTTException("recv_buffer_size must not be negative")
+        self._recv_buffer_size = recv_buffer_size
+        # Validated and encoded publish topics, keyed by the topic as passed in.
+        self._pub_topics = {}
         self._use_binary_mode = use_binary_mode
 
         if recv_timeout <= socket_timeout:
@@ -212,7 +239,7 @@ class MQTT:
             time_int = int(ticks_ms() / 10) % 1000
             self.client_id = f"cpy{randint(0, time_int)}{randint(0, 99)}"
             # generated client_id's enforce spec.'s length rules
-            if len(self.client_id.encode("utf-8")) > 23 or not self.client_id:
+            if len(self._client_id_bytes) > 23 or not self.client_id:
                 raise ValueError("MQTT Client ID must be between 1 and 23 bytes")
 
         # LWT
@@ -248,6 +275,17 @@ class MQTT:
         """De-initializes the MQTT client and disconnects from the mqtt broker."""
         self.disconnect()
 
+    @property
+    def client_id(self) -> str:
+        """MQTT client identifier."""
+        return self._client_id
+
+    @client_id.setter
+    def client_id(self, client_id: str) -> None:
+        self._client_id = client_id
+        # Kept encoded so that connect() does not need to encode it again.
+        self._client_id_bytes = client_id.encode("utf-8")
+
     @property
     def mqtt_msg(self) -> Tuple[int, int]:
         """Returns maximum MQTT payload and topic size."""
@@ -257,21 +295,22 @@ class MQTT:
     def mqtt_msg(self, msg_size: int) -> None:
         """Sets the maximum MQTT message payload size.
 
-        :param int msg_size: Maximum MQTT payload size.
+        :param int msg_size: Maximum MQTT payload size, must be smaller than MQTT_MSG_MAX_SZ.
         """
-        if msg_size < MQTT_MSG_MAX_SZ:
-            self._msg_size_lim = msg_size
+        if msg_size >= MQTT_MSG_MAX_SZ:
+            raise MMQTTException(f"Message size must be smaller than {MQTT_MSG_MAX_SZ} bytes.")
+        self._msg_size_lim = msg_size
 
     def will_set(
         self,
-        topic: str,
+        topic: Union[str, bytes],
         msg: Union[str, int, float, bytes],
         retain: bool = False,
         qos: int = 0,
     ) -> None:
         """Sets the last will and testament properties. MUST be called before `connect()`.
 
-        :param str topic: MQTT Broker topic.
+        :param str|bytes topic: MQTT Broker topic, bytes are taken as already UTF-8 encoded.
         :param str|int|float|bytes msg: Last will disconnection msg.
             msgs of type int & float are converted to a string.
             msgs of type byetes are left unchanged, as it is in the publish function.
@@ -287,45 +326,19 @@ class MQTT:
             raise MMQTTException("Last Will should only be called before connect().")
 
         # check topic/msg/qos kwargs
-        self._valid_topic(topic)
-        if "+" in topic or "#" in topic:
-            raise MMQTTException("Publish topic can not contain wildcards.")
-
-        if msg is None:
-            raise MMQTTException("Message can not be None.")
-        if isinstance(msg, (int, float)):
-            msg = str(msg).encode("ascii")
-        elif isinstance(msg, str):
-            msg = str(msg).encode("utf-8")
-        elif isinstance(msg, bytes):
-            pass
-        else:
-            raise MMQTTException("Invalid message data type.")
-        if len(msg) > MQTT_MSG_MAX_SZ:
-            raise MMQTTException(f"Message size larger than {MQTT_MSG_MAX_SZ} bytes.")
+        # Not through _valid_publish_topic(), the will topic is set once and has no use
+        # for a slot in the publish topic cache.
+        topic_bytes = self._valid_topic(topic)
+        if b"+" in topic_bytes or b"#" in topic_bytes:
+            raise MMQTTException("Last will topic can not contain wildcards.")
+        msg = self._encode_msg(msg)
 
         self._valid_qos(qos)
-        assert 0 <= qos <= 1, "Quality of Service Level 2 is unsupported by this library."
-
-        # fixed header. [3.3.1.2], [3.3.1.3]
-        pub_hdr_fixed = bytearray([MQTT_PUBLISH | retain | qos << 1])
-
-        # variable header = 2-byte Topic length (big endian)
-        pub_hdr_var = bytearray(struct.pack(">H", len(topic.encode("utf-8"))))
-        pub_hdr_var.extend(topic.encode("utf-8"))  # Topic name
-
-        remaining_length = 2 + len(msg) + len(topic.encode("utf-8"))
-        if qos > 0:
-            # packet identifier where QoS level is 1 or 2. [3.3.2.2]
-            remaining_length += 2
-            self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
-            pub_hdr_var.append(self._pid >> 8)
-            pub_hdr_var.append(self._pid & 0xFF)
-
-        self._encode_remaining_length(pub_hdr_fixed, remaining_length)
+        assert qos in (0, 1), "Quality of Service Level 2 is unsupported by this library."
 
         self._lw_qos = qos
-        self._lw_topic = topic
+        # Kept UTF-8 encoded, as sent in the CONNECT payload.
+        self._lw_topic = topic_bytes
         self._lw_msg = msg
         self._lw_retain = retain
         self.logger.debug("Last will properties successfully set")
@@ -372,7 +385,8 @@ class MQTT:
 
     def _handle_on_message(self, topic: str, message: str):
         matched = False
-        if topic is not None:
+        # Skip the topic filter tree walk if no topic callbacks are registered.
+        if topic is not None and self._on_message_filtered:
             for callback in self._on_message_filtered.iter_match(topic):
                 callback(self, topic, message)  # on_msg with callback
                 matched = True
@@ -423,7 +437,7 @@ class MQTT:
                     self._reset_reconnect_backoff()
 
             self.logger.debug(
-                f"Attempting to connect to MQTT broker (attempt #{self._reconnect_attempt})"
+                "Attempting to connect to MQTT broker (attempt #%d)", self._reconnect_attempt
             )
 
             try:
@@ -471,9 +485,11 @@ class MQTT:
         bytes_sent: int = 0
         bytes_to_send = len(buffer)
         view = memoryview(buffer)
+        # Bound once, rather than looked up on the socket for every partial send.
+        send = self._sock.send
         while bytes_sent < bytes_to_send:
             try:
-                bytes_sent += self._sock.send(view[bytes_sent:])
+                bytes_sent += send(view[bytes_sent:])
             except OSError as exc:
                 if exc.errno == errno.EAGAIN:
                     continue
@@ -508,7 +524,7 @@ class MQTT:
 
         if self._reconnect_attempt > 0:
             self.logger.debug(
-                f"Sleeping for {self._reconnect_timeout:.3} seconds due to connect back-off"
+                "Sleeping for %.3g seconds due to connect back-off", self._reconnect_timeout
             )
             time.sleep(self._reconnect_timeout)
 
@@ -523,90 +539,126 @@ class MQTT:
             ssl_context=self._ssl_context,
         )
         self._backwards_compatible_sock = not hasattr(self._sock, "recv_into")
+        # CPython recv_into() returns whatever is available instead of waiting for
+        # the whole buffer to fill, so reads can be served from a read-ahead buffer.
+        if (
+            self._recv_buffer_size
+            and hasattr(self._socket_pool, "timeout")
+            and not self._backwards_compatible_sock
+        ):
+            if self._rx_ahead is None:
+                self._rx_ahead = memoryview(bytearray(self._recv_buffer_size))
+        else:
+            self._rx_ahead = None
+        # MQTT packets are small and written in one go, so there is nothing to gain
+        # from Nagle's algorithm delaying them while waiting for the previous ACK.
+        if (
+            hasattr(self._socket_pool, "IPPROTO_TCP")
+            and hasattr(self._socket_pool, "TCP_NODELAY")
+            and hasattr(self._sock, "setsockopt")
+        ):
+            try:
+                self._sock.setsockopt(
+                    self._socket_pool.IPPROTO_TCP, self._socket_pool.TCP_NODELAY, 1
+                )
+            except OSError as e:
+                self.logger.debug("Could not disable Nagle's algorithm: %s", e)
 
         fixed_header = bytearray([0x10])
 
         # Variable CONNECT header [MQTT 3.1.2]
-        # The byte array is used as a template.
-        var_header = bytearray(b"\x00\x04MQTT\x04\x02\0\0")
+        var_header = bytearray(MQTT_HDR_CONNECT)
         var_header[7] = clean_session << 1
 
-        # Set up variable header and remaining_length
-        remaining_length = 12 + len(self.client_id.encode("utf-8"))
-        if self._username is not None:
-            remaining_length += (
-                2 + len(self._username.encode("utf-8")) + 2 + len(self._password.encode("utf-8"))
-            )
-            var_header[7] |= 0xC0
+        # Encode the payload strings once, the remaining length is computed
+        # from their UTF-8 byte lengths [MQTT-1.5.3].
+        client_id = self._client_id_bytes
+        lw_topic = self._lw_topic
+        username = self._username.encode("utf-8") if self._username is not None else None
+        password = self._password.encode("utf-8") if self._password is not None else None
+
+        # Set up variable header and the payload fields, in the order given by [MQTT-3.1.3-1]
+        # [MQTT-3.1.3-3]
+        fields = [client_id]
         if self.keep_alive:
             assert self.keep_alive < MQTT_TOPIC_LENGTH_LIMIT
             var_header[8] |= self.keep_alive >> 8
             var_header[9] |= self.keep_alive & 0x00FF
-        if self._lw_topic:
-            remaining_length += 2 + len(self._lw_topic.encode("utf-8")) + 2 + len(self._lw_msg)
+        if lw_topic:
+            # [MQTT-3.1.3-11]
+            fields.append(lw_topic)
+            fields.append(self._lw_msg)
             var_header[7] |= 0x4 | (self._lw_qos & 0x1) << 3 | (self._lw_qos & 0x2) << 3
             var_header[7] |= self._lw_retain << 5
-
+        if username is not None:
+            fields.append(username)
+            var_header[7] |= 0x80
+            # [MQTT-3.1.2-22] password may only be present with a username
+            if password is not None:
+                fields.append(password)
+                var_header[7] |= 0x40
+
+        remaining_length = len(var_header) + sum(2 + len(field) for field in fields)
         self._encode_remaining_length(fixed_header, remaining_length)
         self.logger.debug("Sending CONNECT to broker...")
-        self.logger.debug(f"Fixed Header: {fixed_header}")
-        self.logger.debug(f"Variable Header: {var_header}")
-        self._send_bytes(fixed_header)
-        self._send_bytes(var_header)
-        # [MQTT-3.1.3-4]
-        self._send_str(self.client_id)
-        if self._lw_topic:
-            # [MQTT-3.1.3-11]
-            self._send_str(self._lw_topic)
-            self._send_str(self._lw_msg)
-        if self._username is not None:
-            self._send_str(self._username)
-            self._send_str(self._password)
+        self.logger.debug("Fixed Header: %s", fixed_header)
+        self.logger.debug("Variable Header: %s", var_header)
+        # Each payload field is prefixed with its 2-byte length,
+        # and the whole packet goes out with a single send.
+        packet = fixed_header + var_header
+        for field in fields:
+            packet.extend(struct.pack(f">H{len(field)}s", len(field), field))
+        self._send_bytes(packet)
         self._last_msg_sent_timestamp = ticks_ms()
         self.logger.debug("Receiving CONNACK packet from broker")
-        stamp = ticks_ms()
-        while True:
-            op = self._wait_for_msg()
-            if op == 32:
-                rc = self._sock_exact_recv(3)
-                assert rc[0] == 0x02
-                if rc[2] != 0x00:
-                    raise MMQTTException(CONNACK_ERRORS[rc[2]], code=rc[2])
-                self._is_connected = True
-                result = rc[0] & 1
-                if self.on_connect is not None:
-                    self.on_connect(self, self.user_data, result, rc[2])
-
-                return result
-
-            if op is None:
-                if ticks_diff(ticks_ms(), stamp) / 1000 > self._recv_timeout:
-                    raise MMQTTException(
-                        f"No data received from broker for {self._recv_timeout} seconds."
-                    )
+        self._wait_for_op(MQTT_CONNACK, ticks_ms())
+        rc = self._sock_exact_recv(3, buf=self._rx_view(3))
+        # Remaining length and return code checked with one compare, the acknowledge
+        # flags in between are masked out.
+        if int.from_bytes(rc, "big") & 0xFF00FF != 0x020000:
+            assert rc[0] == 0x02
+            raise MMQTTException(CONNACK_ERRORS[rc[2]], code=rc[2])
+        self._is_connected = True
+        result = rc[1] & 1
+        if self.on_connect is not None:
+            self.on_connect(self, self.user_data, result, 0)
+
+        return result
 
     def _close_socket(self):
+        # Without a socket there is no session, keep is_connected() in step.
+        self._is_connected = False
+        # Whatever was read ahead belongs to the old connection.
+        self._rx_start = self._rx_end = 0
         if self._sock:
             self.logger.debug("Closing socket")
             self._connection_manager.close_socket(self._sock)
             self._sock = None
 
     def _encode_remaining_length(self, fixed_header: bytearray, remaining_length: int) -> None:
-        """Encode Remaining Length [2.2.3]"""
+        """Encode Remaining Length [2.2.3] and append it to the fixed header"""
+        encoded = bytearray(4)
+        end = self._pack_remaining_length(encoded, 0, remaining_length)
+        fixed_header.extend(memoryview(encoded)[:end])
+
+    @staticmethod
+    def _pack_remaining_length(buf: bytearray, offset: int, remaining_length: int) -> int:
+        """Encode Remaining Length [2.2.3] into buf, which must have room for 4 bytes
+        at offset. Returns the offset past the encoded length."""
         if remaining_length > 268_435_455:
             raise MMQTTException("invalid remaining length")
 
         # Remaining length calculation
-        if remaining_length > 0x7F:
-            while remaining_length > 0:
-                encoded_byte = remaining_length % 0x80
-                remaining_length = remaining_length // 0x80
-                # if there is more data to encode, set the top bit of the byte
-                if remaining_length > 0:
-                    encoded_byte |= 0x80
-                fixed_header.append(encoded_byte)
-        else:
-            fixed_header.append(remaining_length)
+        while True:
+            encoded_byte = remaining_length % 0x80
+            remaining_length = remaining_length // 0x80
+            # if there is more data to encode, set the top bit of the byte
+            if remaining_length > 0:
+                encoded_byte |= 0x80
+            buf[offset] = encoded_byte
+            offset += 1
+            if remaining_length == 0:
+                return offset
 
     def disconnect(self) -> None:
         """Disconnects the MiniMQTT client from the MQTT broker."""
@@ -617,7 +669,6 @@ class MQTT:
         except (MemoryError, OSError, RuntimeError) as e:
             self.logger.warning(f"Unable to send DISCONNECT packet: {e}")
         self._close_socket()
-        self._is_connected = False
         self._subscribed_topics = []
         self._last_msg_sent_timestamp = 0
         if self.on_disconnect is not None:
@@ -632,6 +683,7 @@ class MQTT:
         self.logger.debug("Sending PINGREQ")
         self._send_bytes(MQTT_PINGREQ)
         ping_timeout = self.keep_alive
+        ping_timeout_ms = ping_timeout * 1000
         stamp = ticks_ms()
 
         self._last_msg_sent_timestamp = stamp
@@ -640,32 +692,84 @@ class MQTT:
             rc = self._wait_for_msg()
             if rc:
                 rcs.append(rc)
-            if ticks_diff(ticks_ms(), stamp) / 1000 > ping_timeout:
+            if ticks_diff(ticks_ms(), stamp) > ping_timeout_ms:
                 raise MMQTTException(
                     f"PINGRESP not returned from broker within {ping_timeout} seconds."
                 )
         return rcs
 
-    def publish(  # noqa:  PLR0912, Too many branches
+    def publish(
         self,
-        topic: str,
+        topic: Union[str, bytes],
         msg: Union[str, int, float, bytes],
         retain: bool = False,
         qos: int = 0,
     ) -> None:
         """Publishes a message to a topic provided.
 
-        :param str topic: Unique topic identifier.
+        :param str|bytes topic: Unique topic identifier. Topics that are published
+            repeatedly may be passed already UTF-8 encoded to skip encoding them every time.
         :param str|int|float|bytes msg: Data to send to the broker.
         :param bool retain: Whether the message is saved by the broker.
         :param int qos: Quality of Service level for the message, defaults to zero.
 
         """
         self._connected()
-        self._valid_topic(topic)
-        if "+" in topic or "#" in topic:
-            raise MMQTTException("Publish topic can not contain wildcards.")
-        # check msg/qos kwargs
+        topic_bytes = self._valid_publish_topic(topic)
+        self._publish(topic, topic_bytes, msg, retain, qos)
+
+    def make_publisher(self, topic: Union[str, bytes], retain: bool = False, qos: int = 0):
+        """Returns a function which publishes messages to the topic provided.
+        The topic is validated and encoded once here instead of on every call,
+        which suits code that keeps publishing to the same feed in a loop.
+
+        :param str|bytes topic: Unique topic identifier.
+        :param bool retain: Whether the messages are saved by the broker.
+        :param int qos: Quality of Service level for the messages, defaults to zero.
+
+        Expected signature of the returned function is ``publish(msg)``,
+        where ``msg`` is handled the same way as in `publish()`.
+        """
+        topic_bytes = self._valid_publish_topic(topic)
+
+        def publisher(msg: Union[str, int, float, bytes]) -> None:
+            self._connected()
+            self._publish(topic, topic_bytes, msg, retain, qos)
+
+        return publisher
+
+    def publish_many(self, messages: list, retain: bool = False) -> None:
+        """Publishes several messages with Quality of Service level zero, sending them
+        to the broker all at once rather than one by one.
+
+        :param list messages: ``(topic, msg)`` tuples, with ``topic`` and ``msg``
+            as in `publish()`.
+        :param bool retain: Whether the messages are saved by the broker.
+
+        """
+        self._connected()
+        # Validate everything first, so that either all or none of the messages are sent.
+        encoded = [
+            (topic, self._valid_publish_topic(topic), self._encode_msg(msg))
+            for topic, msg in messages
+        ]
+        packets = bytearray()
+        for topic, topic_bytes, msg in encoded:
+            packets.extend(self._encode_publish_header(topic_bytes, len(msg), retain, 0))
+            packets.extend(msg)
+        self.logger.debug("Sending %d PUBLISH packets", len(encoded))
+        self._send_bytes(packets)
+        self._last_msg_sent_timestamp = ticks_ms()
+        if self.on_publish is not None:
+            for topic, _, _ in encoded:
+                self.on_publish(self, self.user_data, topic, self._pid)
+
+    @staticmethod
+    def _encode_msg(msg: Union[str, int, float, bytes]) -> bytes:
+        """Converts a message to the bytes sent to the broker.
+
+        :param str|int|float|bytes msg: Data to send to the broker.
+        """
         if msg is None:
             raise MMQTTException("Message can not be None.")
         if isinstance(msg, (int, float)):
@@ -678,24 +782,22 @@ class MQTT:
             raise MMQTTException("Invalid message data type.")
         if len(msg) > MQTT_MSG_MAX_SZ:
             raise MMQTTException(f"Message size larger than {MQTT_MSG_MAX_SZ} bytes.")
-        assert 0 <= qos <= 1, "Quality of Service Level 2 is unsupported by this library."
+        return msg
 
-        # fixed header. [3.3.1.2], [3.3.1.3]
-        pub_hdr_fixed = bytearray([MQTT_PUBLISH | retain | qos << 1])
-
-        # variable header = 2-byte Topic length (big endian)
-        pub_hdr_var = bytearray(struct.pack(">H", len(topic.encode("utf-8"))))
-        pub_hdr_var.extend(topic.encode("utf-8"))  # Topic name
-
-        remaining_length = 2 + len(msg) + len(topic.encode("utf-8"))
-        if qos > 0:
-            # packet identifier where QoS level is 1 or 2. [3.3.2.2]
-            remaining_length += 2
-            self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
-            pub_hdr_var.append(self._pid >> 8)
-            pub_hdr_var.append(self._pid & 0xFF)
+    def _publish(  # noqa: PLR0913, Too many arguments
+        self,
+        topic: Union[str, bytes],
+        topic_bytes: bytes,
+        msg: Union[str, int, float, bytes],
+        retain: bool,
+        qos: int,
+    ) -> None:
+        """Publishes a message to an already validated and encoded topic."""
+        # check msg/qos kwargs
+        msg = self._encode_msg(msg)
+        assert qos in (0, 1), "Quality of Service Level 2 is unsupported by this library."
 
-        self._encode_remaining_length(pub_hdr_fixed, remaining_length)
+        pub_hdr = self._encode_publish_header(topic_bytes, len(msg), retain, qos)
 
         self.logger.debug(
             "Sending PUBLISH\nTopic: %s\nMsg: %s\
@@ -705,31 +807,67 @@ class MQTT:
             qos,
             retain,
         )
-        self._send_bytes(pub_hdr_fixed)
-        self._send_bytes(pub_hdr_var)
-        self._send_bytes(msg)
+        hdr_len = len(pub_hdr)
+        pkt_len = hdr_len + len(msg)
+        if pkt_len <= len(self._tx_buf):
+            # Small packets are sent whole from the transmit buffer, in one segment.
+            self._tx_buf[hdr_len:pkt_len] = msg
+            self._send_bytes(memoryview(self._tx_buf)[:pkt_len])
+        else:
+            self._send_bytes(pub_hdr)
+            self._send_bytes(msg)
         self._last_msg_sent_timestamp = ticks_ms()
         if qos == 0 and self.on_publish is not None:
             self.on_publish(self, self.user_data, topic, self._pid)
         if qos == 1:
             stamp = ticks_ms()
             while True:
-                op = self._wait_for_msg()
-                if op == 0x40:
-                    sz = self._sock_exact_recv(1)
-                    assert sz == b"\x02"
-                    rcv_pid_buf = self._sock_exact_recv(2)
-                    rcv_pid = rcv_pid_buf[0] << 0x08 | rcv_pid_buf[1]
-                    if self._pid == rcv_pid:
-                        if self.on_publish is not None:
-                            self.on_publish(self, self.user_data, topic, rcv_pid)
-                        return
-
-                if op is None:
-                    if ticks_diff(ticks_ms(), stamp) / 1000 > self._recv_timeout:
-                        raise MMQTTException(
-                            f"No data received from broker for {self._recv_timeout} seconds."
-                        )
+                # PUBACKs for other packet identifiers are skipped.
+                self._wait_for_op(MQTT_PUBACK, stamp)
+                sz = self._recv_byte()
+                assert sz == 0x02
+                rcv_pid_buf = self._sock_exact_recv(2, buf=self._rx_word)
+                rcv_pid = rcv_pid_buf[0] << 0x08 | rcv_pid_buf[1]
+                if self._pid == rcv_pid:
+                    if self.on_publish is not None:
+                        self.on_publish(self, self.user_data, topic, rcv_pid)
+                    return
+
+    def _encode_publish_header(
+        self, topic_bytes: bytes, msg_len: int, retain: bool, qos: int
+    ) -> memoryview:
+        """Assembles the PUBLISH fixed and variable headers in the reusable transmit buffer,
+        which only grows when a longer topic comes along. It also grows to leave room for
+        the payload after the headers, for packets up to MQTT_TX_PKT_SZ bytes.
+
+        :return: view of the headers, valid until the next call.
+        """
+        # fixed header (1 + up to 4 bytes of remaining length) and variable header
+        # (2 bytes of topic length + topic + 2 bytes of packet identifier)
+        hdr_size = 9 + len(topic_bytes)
+        if hdr_size + msg_len <= MQTT_TX_PKT_SZ:
+            hdr_size += msg_len
+        if len(self._tx_buf) < hdr_size:
+            self._tx_buf = bytearray(hdr_size)
+        pub_hdr = self._tx_buf
+
+        # fixed header. [3.3.1.2], [3.3.1.3]
+        pub_hdr[0] = MQTT_PUBLISH | retain | qos << 1
+        remaining_length = 2 + len(topic_bytes) + msg_len
+        if qos > 0:
+            # packet identifier where QoS level is 1 or 2. [3.3.2.2]
+            remaining_length += 2
+        offset = self._pack_remaining_length(pub_hdr, 1, remaining_length)
+
+        # variable header = 2-byte Topic length (big endian)
+        struct.pack_into(">H", pub_hdr, offset, len(topic_bytes))
+        offset += 2
+        pub_hdr[offset : offset + len(topic_bytes)] = topic_bytes  # Topic name
+        offset += len(topic_bytes)
+        if qos > 0:
+            struct.pack_into(">H", pub_hdr, offset, self._next_pid())
+            offset += 2
+        return memoryview(pub_hdr)[:offset]
 
     def subscribe(  # noqa: PLR0912, PLR0915, Too many branches, Too many statements
         self, topic: Optional[Union[tuple, str, list]], qos: int = 0
@@ -744,85 +882,66 @@ class MQTT:
                                      each list element should be a tuple containing
                                      a topic identifier string and qos level integer.
         :param int qos: Quality of Service level for the topic, defaults to
-                        zero. Conventional options are ``0`` (send at most once), ``1``
-                        (send at least once), or ``2`` (send exactly once).
+                        zero. Options are ``0`` (send at most once) or ``1``
+                        (send at least once). ``2`` (send exactly once) is
+                        unsupported and raises `MMQTTException`.
 
         """
         self._connected()
         topics = None
         if isinstance(topic, tuple):
             topic, qos = topic
-            self._valid_topic(topic)
-            self._valid_qos(qos)
         if isinstance(topic, str):
-            self._valid_topic(topic)
-            self._valid_qos(qos)
             topics = [(topic, qos)]
-        if isinstance(topic, list):
-            topics = []
-            for t, q in topic:
-                self._valid_qos(q)
-                self._valid_topic(t)
-                topics.append((t, q))
-        # Assemble packet
+        elif isinstance(topic, list):
+            topics = list(topic)
+        else:
+            raise MMQTTException(f"Topic may not be {type(topic).__name__}")
+        # Encode each topic once, validating it along the way.
+        topics_bytes = []
+        for t, q in topics:
+            # Filters are kept as str, reconnect resubscribes from _subscribed_topics.
+            if not isinstance(t, str):
+                raise MMQTTException(f"Topic may not be {type(t).__name__}")
+            self._valid_qos(q)
+            # Incoming QoS 2 messages can not be acknowledged, see _wait_for_msg().
+            if q == 2:
+                raise MMQTTException("Quality of Service Level 2 is unsupported by this library.")
+            topics_bytes.append(self._valid_topic(t))
+        # Assemble packet, all topics go in a single SUBSCRIBE sent at once [MQTT-3.8.3]
         self.logger.debug("Sending SUBSCRIBE to broker...")
-        fixed_header = bytearray([MQTT_SUB])
+        packet = bytearray([MQTT_SUB])
         packet_length = 2 + (2 * len(topics)) + (1 * len(topics))
-        packet_length += sum(len(topic.encode("utf-8")) for topic, qos in topics)
-        self._encode_remaining_length(fixed_header, remaining_length=packet_length)
-        self.logger.debug(f"Fixed Header: {fixed_header}")
-        self._send_bytes(fixed_header)
-        self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
-        packet_id_bytes = self._pid.to_bytes(2, "big")
+        packet_length += sum(len(topic_bytes) for topic_bytes in topics_bytes)
+        self._encode_remaining_length(packet, remaining_length=packet_length)
+        self.logger.debug("Fixed Header: %s", packet)
+        packet_id_bytes = struct.pack(">H", self._next_pid())
         var_header = packet_id_bytes
-        self.logger.debug(f"Variable Header: {var_header}")
-        self._send_bytes(var_header)
+        self.logger.debug("Variable Header: %s", var_header)
+        packet.extend(var_header)
         # attaching topic and QOS level to the packet
-        payload = b""
+        for topic_bytes, (_, q) in zip(topics_bytes, topics):
+            packet.extend(struct.pack(f">H{len(topic_bytes)}sB", len(topic_bytes), topic_bytes, q))
         for t, q in topics:
-            topic_size = len(t.encode("utf-8")).to_bytes(2, "big")
-            qos_byte = q.to_bytes(1, "big")
-            payload += topic_size + t.encode() + qos_byte
-        for t, q in topics:
-            self.logger.debug(f"SUBSCRIBING to topic {t} with QoS {q}")
-        self.logger.debug(f"payload: {payload}")
-        self._send_bytes(payload)
+            self.logger.debug("SUBSCRIBING to topic %s with QoS %d", t, q)
+        self._send_bytes(packet)
         stamp = ticks_ms()
         self._last_msg_sent_timestamp = stamp
-        while True:
-            op = self._wait_for_msg()
-            if op is None:
-                if ticks_diff(ticks_ms(), stamp) / 1000 > self._recv_timeout:
-                    raise MMQTTException(
-                        f"No data received from broker for {self._recv_timeout} seconds."
-                    )
-            else:
-                if op == 0x90:
-                    remaining_len = self._decode_remaining_length()
-                    assert remaining_len > 0
-                    rc = self._sock_exact_recv(2)
-                    # Check packet identifier.
-                    assert rc[0] == var_header[0] and rc[1] == var_header[1]
-                    rc = self._sock_exact_recv(remaining_len - 2)
-                    for i in range(0, remaining_len - 2):
-                        if rc[i] not in [0, 1, 2]:
-                            raise MMQTTException(
-                                f"SUBACK Failure for topic {topics[i][0]}: {hex(rc[i])}"
-                            )
-
-                    for t, q in topics:
-                        if self.on_subscribe is not None:
-                            self.on_subscribe(self, self.user_data, t, q)
-                        self._subscribed_topics.append(t)
-
-                    return
+        self._wait_for_op(MQTT_SUBACK, stamp, request="SUBSCRIBE")
+        remaining_len = self._decode_remaining_length()
+        assert remaining_len > 0
+        rc = self._sock_exact_recv(2, buf=self._rx_word)
+        # Check packet identifier.
+        assert rc[0] == var_header[0] and rc[1] == var_header[1]
+        rc = self._sock_exact_recv(remaining_len - 2, buf=self._rx_view(remaining_len - 2))
+        for i in range(0, remaining_len - 2):
+            if rc[i] not in [0, 1, 2]:
+                raise MMQTTException(f"SUBACK Failure for topic {topics[i][0]}: {hex(rc[i])}")
 
-                if op != MQTT_PUBLISH:
-                    # [3.8.4] The Server is permitted to start sending PUBLISH packets
-                    # matching the Subscription before the Server sends the SUBACK Packet.
-                    raise MMQTTException(
-                        f"invalid message received as response to SUBSCRIBE: {hex(op)}"
-                    )
+        for t, q in topics:
+            if self.on_subscribe is not None:
+                self.on_subscribe(self, self.user_data, t, q)
+            self._subscribed_topics.append(t)
 
     def unsubscribe(  # noqa: PLR0912, Too many branches
         self, topic: Optional[Union[str, list]]
@@ -834,61 +953,54 @@ class MQTT:
         """
         topics = None
         if isinstance(topic, str):
-            self._valid_topic(topic)
             topics = [(topic)]
-        if isinstance(topic, list):
-            topics = []
-            for t in topic:
-                self._valid_topic(t)
-                topics.append(t)
+        elif isinstance(topic, list):
+            topics = list(topic)
+        else:
+            raise MMQTTException(f"Topic may not be {type(topic).__name__}")
+        for t in topics:
+            if not isinstance(t, str):
+                raise MMQTTException(f"Topic may not be {type(t).__name__}")
+        topics_bytes = [self._valid_topic(t) for t in topics]
         for t in topics:
             if t not in self._subscribed_topics:
                 raise MMQTTException("Topic must be subscribed to before attempting unsubscribe.")
-        # Assemble packet
+        # Assemble packet, all topics go in a single UNSUBSCRIBE sent at once [MQTT-3.10.3]
         self.logger.debug("Sending UNSUBSCRIBE to broker...")
-        fixed_header = bytearray([MQTT_UNSUB])
+        packet = bytearray([MQTT_UNSUB])
         packet_length = 2 + (2 * len(topics))
-        packet_length += sum(len(topic.encode("utf-8")) for topic in topics)
-        self._encode_remaining_length(fixed_header, remaining_length=packet_length)
-        self.logger.debug(f"Fixed Header: {fixed_header}")
-        self._send_bytes(fixed_header)
-        self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
-        packet_id_bytes = self._pid.to_bytes(2, "big")
+        packet_length += sum(len(topic_bytes) for topic_bytes in topics_bytes)
+        self._encode_remaining_length(packet, remaining_length=packet_length)
+        self.logger.debug("Fixed Header: %s", packet)
+        packet_id_bytes = struct.pack(">H", self._next_pid())
         var_header = packet_id_bytes
-        self.logger.debug(f"Variable Header: {var_header}")
-        self._send_bytes(var_header)
-        payload = b""
-        for t in topics:
-            topic_size = len(t.encode("utf-8")).to_bytes(2, "big")
-            payload += topic_size + t.encode()
+        self.logger.debug("Variable Header: %s", var_header)
+        packet.extend(var_header)
+        for topic_bytes in topics_bytes:
+            packet.extend(struct.pack(f">H{len(topic_bytes)}s", len(topic_bytes), topic_bytes))
         for t in topics:
-            self.logger.debug(f"UNSUBSCRIBING from topic {t}")
-        self._send_bytes(payload)
-        self._last_msg_sent_timestamp = ticks_ms()
+            self.logger.debug("UNSUBSCRIBING from topic %s", t)
+        self._send_bytes(packet)
+        stamp = ticks_ms()
+        self._last_msg_sent_timestamp = stamp
         self.logger.debug("Waiting for UNSUBACK...")
-        while True:
-            stamp = ticks_ms()
-            op = self._wait_for_msg()
-            if op is None:
-                if ticks_diff(ticks_ms(), stamp) / 1000 > self._recv_timeout:
-                    raise MMQTTException(
-                        f"No data received from broker for {self._recv_timeout} seconds."
-                    )
-            else:
-                if op == 176:
-                    rc = self._sock_exact_recv(3)
-                    assert rc[0] == 0x02
-                    # [MQTT-3.32]
-                    assert rc[1] == packet_id_bytes[0] and rc[2] == packet_id_bytes[1]
-                    for t in topics:
-                        if self.on_unsubscribe is not None:
-                            self.on_unsubscribe(self, self.user_data, t, self._pid)
-                        self._subscribed_topics.remove(t)
-                    return
+        self._wait_for_op(MQTT_UNSUBACK, stamp, request="UNSUBSCRIBE")
+        rc = self._sock_exact_recv(3, buf=self._rx_view(3))
+        assert rc[0] == 0x02
+        # [MQTT-3.32]
+        assert rc[1] == packet_id_bytes[0] and rc[2] == packet_id_bytes[1]
+        for t in topics:
+            if self.on_unsubscribe is not None:
+                self.on_unsubscribe(self, self.user_data, t, self._pid)
+            self._subscribed_topics.remove(t)
 
-                raise MMQTTException(
-                    f"invalid message received as response to UNSUBSCRIBE: {hex(op)}"
-                )
+    def _next_pid(self) -> int:
+        """Advance the packet identifier, which is a non-zero 16-bit integer [2.3.1].
+
+        :return: the new packet identifier
+        """
+        self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
+        return self._pid
 
     def _recompute_reconnect_backoff(self) -> None:
         """
@@ -898,18 +1010,18 @@ class MQTT:
         """
         self._reconnect_attempt = self._reconnect_attempt + 1
         self._reconnect_timeout = 2**self._reconnect_attempt
-        self.logger.debug(f"Reconnect timeout computed to {self._reconnect_timeout:.2f}")
+        self.logger.debug("Reconnect timeout computed to %.2f", self._reconnect_timeout)
 
         if self._reconnect_timeout > self._reconnect_maximum_backoff:
             self.logger.debug(
-                f"Truncating reconnect timeout to {self._reconnect_maximum_backoff} seconds"
+                "Truncating reconnect timeout to %s seconds", self._reconnect_maximum_backoff
             )
             self._reconnect_timeout = float(self._reconnect_maximum_backoff)
 
         # Add a sub-second jitter.
         # Even truncated timeout should have jitter added to it. This is why it is added here.
         jitter = randint(0, 1000) / 1000
-        self.logger.debug(f"adding jitter {jitter:.2f} to {self._reconnect_timeout:.2f} seconds")
+        self.logger.debug("adding jitter %.2f to %.2f seconds", jitter, self._reconnect_timeout)
         self._reconnect_timeout += jitter
 
     def _reset_reconnect_backoff(self) -> None:
@@ -957,13 +1069,19 @@ class MQTT:
             )
 
         self._connected()
-        self.logger.debug(f"waiting for messages for {timeout} seconds")
-
+        # Logging arguments are passed separately so that they are only formatted
+        # when the message is actually logged, loop() is typically called all the time.
+        self.logger.debug("waiting for messages for %s seconds", timeout)
+
+        # Compare integer milliseconds so that the polling loop does not need
+        # a float division for each of its checks.
+        timeout_ms = int(timeout * 1000)
+        keep_alive_ms = self.keep_alive * 1000
         stamp = ticks_ms()
         rcs = []
 
         while True:
-            if ticks_diff(ticks_ms(), self._last_msg_sent_timestamp) / 1000 >= self.keep_alive:
+            if ticks_diff(ticks_ms(), self._last_msg_sent_timestamp) >= keep_alive_ms:
                 # Handle KeepAlive by expecting a PINGREQ/PINGRESP from the server
                 self.logger.debug(
                     "KeepAlive period elapsed - requesting a PINGRESP from the server..."
@@ -971,15 +1089,15 @@ class MQTT:
                 rcs.extend(self.ping())
                 # ping() itself contains a _wait_for_msg() loop which might have taken a while,
                 # so check here as well.
-                if ticks_diff(ticks_ms(), stamp) / 1000 > timeout:
-                    self.logger.debug(f"Loop timed out after {timeout} seconds")
+                if ticks_diff(ticks_ms(), stamp) > timeout_ms:
+                    self.logger.debug("Loop timed out after %s seconds", timeout)
                     break
 
             rc = self._wait_for_msg()
             if rc is not None:
                 rcs.append(rc)
-            if ticks_diff(ticks_ms(), stamp) / 1000 > timeout:
-                self.logger.debug(f"Loop timed out after {timeout} seconds")
+            if ticks_diff(ticks_ms(), stamp) > timeout_ms:
+                self.logger.debug("Loop timed out after %s seconds", timeout)
                 break
 
         return rcs if rcs else None
@@ -995,12 +1113,12 @@ class MQTT:
         # CPython socket module contains a timeout attribute
         if hasattr(self._socket_pool, "timeout"):
             try:
-                res = self._sock_exact_recv(1)
+                res = self._sock_exact_recv(1, buf=self._rx_byte)
             except self._socket_pool.timeout:
                 return None
         else:  # socketpool, esp32spi, wiznet5k
             try:
-                res = self._sock_exact_recv(1, timeout=timeout)
+                res = self._sock_exact_recv(1, timeout=timeout, buf=self._rx_byte)
             except OSError as error:
                 if error.errno in (errno.ETIMEDOUT, errno.EAGAIN):
                     # raised by a socket timeout if 0 bytes were present
@@ -1010,11 +1128,13 @@ class MQTT:
         if res in [None, b"", b"\x00"]:
             # If we get here, it means that there is nothing to be received
             return None
-        pkt_type = res[0] & MQTT_PKT_TYPE_MASK
-        self.logger.debug(f"Got message type: {hex(pkt_type)} pkt: {hex(res[0])}")
+        # The receive buffer is reused by the reads below, so keep the header byte.
+        header = res[0]
+        pkt_type = header & MQTT_PKT_TYPE_MASK
+        self.logger.debug("Got message type: %#x pkt: %#x", pkt_type, header)
         if pkt_type == MQTT_PINGRESP:
             self.logger.debug("Got PINGRESP")
-            sz = self._sock_exact_recv(1)[0]
+            sz = self._recv_byte()
             if sz != 0x00:
                 raise MMQTTException(f"Unexpected PINGRESP returned from broker: {sz}.")
             return pkt_type
@@ -1025,7 +1145,7 @@ class MQTT:
         # Handle only the PUBLISH packet type from now on.
         sz = self._decode_remaining_length()
         # topic length MSB & LSB
-        topic_len_buf = self._sock_exact_recv(2)
+        topic_len_buf = self._sock_exact_recv(2, buf=self._rx_word)
         topic_len = int((topic_len_buf[0] << 8) | topic_len_buf[1])
 
         if topic_len > sz - 2:
@@ -1033,43 +1153,100 @@ class MQTT:
                 f"Topic length {topic_len} in PUBLISH packet exceeds remaining length {sz} - 2"
             )
 
-        topic_buf = self._sock_exact_recv(topic_len)
+        topic_buf = self._sock_exact_recv(topic_len, buf=self._rx_view(topic_len))
         topic = str(topic_buf, "utf-8")
         sz -= topic_len + 2
         pid = 0
-        if res[0] & 0x06:
-            pid_buf = self._sock_exact_recv(2)
+        qos = (header >> 1) & 0x03
+        if qos:
+            pid_buf = self._sock_exact_recv(2, buf=self._rx_word)
             pid = pid_buf[0] << 0x08 | pid_buf[1]
             sz -= 0x02
 
         # read message contents
         raw_msg = self._sock_exact_recv(sz)
-        msg = raw_msg if self._use_binary_mode else str(raw_msg, "utf-8")
         self.logger.debug("Receiving PUBLISH \nTopic: %s\nMsg: %s\n", topic, raw_msg)
+        if qos == 2:
+            # Raised before dispatching: without a PUBREC the broker redelivers the
+            # message, which must not reach on_message again on every reconnect.
+            # The message was read in full, so the connection stays usable.
+            raise MMQTTException("Quality of Service Level 2 is unsupported by this library.")
+        msg = raw_msg if self._use_binary_mode else str(raw_msg, "utf-8")
         self._handle_on_message(topic, msg)
-        if res[0] & 0x06 == 0x02:
-            pkt = bytearray(b"\x40\x02\0\0")
-            struct.pack_into("!H", pkt, 2, pid)
-            self._send_bytes(pkt)
-        elif res[0] & 6 == 4:
-            assert 0
+        if qos == 1:
+            self._send_bytes(struct.pack(">BBH", MQTT_PUBACK, 0x02, pid))
 
         return pkt_type
 
+    def _wait_for_op(self, expected: int, stamp: int, request: Optional[str] = None) -> None:
+        """Processes incoming packets until one of the expected type is received.
+        Its variable header and payload are left for the caller to read.
+
+        :param int expected: packet type to wait for.
+        :param int stamp: time the request was sent, in ticks_ms().
+        :param str request: name of the request being acknowledged. If set, packets other
+            than the expected one and PUBLISH are rejected as an invalid response.
+        """
+        recv_timeout_ms = self._recv_timeout * 1000
+        while True:
+            op = self._wait_for_msg()
+            if op == expected:
+                return
+            # [3.8.4] The Server is permitted to start sending PUBLISH packets
+            # matching the Subscription before the Server sends the SUBACK Packet.
+            if op is not None and request is not None and op != MQTT_PUBLISH:
+                raise MMQTTException(
+                    f"invalid message received as response to {request}: {hex(op)}"
+                )
+            if ticks_diff(ticks_ms(), stamp) > recv_timeout_ms:
+                raise MMQTTException(
+                    f"No data received from broker for {self._recv_timeout} seconds."
+                )
+
     def _decode_remaining_length(self) -> int:
         """Decode Remaining Length [2.2.3]"""
-        n = 0
-        sh = 0
-        while True:
-            if sh > 28:
-                raise MMQTTException("invalid remaining length encoding")
-            b = self._sock_exact_recv(1)[0]
+        b = self._recv_byte()
+        # Packets shorter than 128 bytes, by far the most common ones, need a single byte.
+        if not b & 0x80:
+            return b
+        n = b & 0x7F
+        # The encoding takes at most four bytes.
+        for sh in (7, 14, 21):
+            b = self._recv_byte()
             n |= (b & 0x7F) << sh
             if not b & 0x80:
                 return n
-            sh += 7
+        raise MMQTTException("invalid remaining length encoding")
+
+    def _recv_byte(self) -> int:
+        """Reads a single byte from the connected socket.
+
+        :return: the byte, as an integer
+        """
+        # Fast paths for the byte already being read ahead, or being available at once.
+        if self._rx_ahead is not None:
+            start = self._rx_start
+            if start < self._rx_end:
+                self._rx_start = start + 1
+                return self._rx_ahead[start]
+        elif not self._backwards_compatible_sock:
+            if self._sock.recv_into(self._rx_byte, 1) == 1:
+                return self._rx_byte[0]
+        return self._sock_exact_recv(1, buf=self._rx_byte)[0]
+
+    def _rx_view(self, size: int) -> memoryview:
+        """Returns a view of size bytes of the reusable receive buffer, which is grown
+        when needed. The data received into it is only valid until the next such view.
+
+        :param int size: number of bytes
+        """
+        if size > len(self._rx_buf):
+            self._rx_buf = bytearray(size)
+        return memoryview(self._rx_buf)[:size]
 
-    def _sock_exact_recv(self, bufsize: int, timeout: Optional[float] = None) -> bytearray:
+    def _sock_exact_recv(
+        self, bufsize: int, timeout: Optional[float] = None, buf: Optional[bytearray] = None
+    ) -> bytearray:
         """Reads _exact_ number of bytes from the connected socket. Will only return
         bytearray with the exact number of bytes requested.
 
@@ -1081,30 +1258,41 @@ class MQTT:
 
         :param int bufsize: number of bytes to receive
         :param float timeout: timeout, in seconds. Defaults to keep_alive
+        :param bytearray buf: optional preallocated buffer or memoryview of exactly
+            bufsize bytes to receive into instead of allocating a new one. Its contents
+            are only valid until it is passed in again. Legacy sockets without recv_into()
+            return a new buffer regardless.
         :return: byte array
         """
+        if self._rx_ahead is not None:
+            return self._buffered_recv(bufsize, timeout, buf)
         stamp = ticks_ms()
         if not self._backwards_compatible_sock:
             # CPython, socketpool, esp32spi, wiznet5k
-            rc = bytearray(bufsize)
-            mv = memoryview(rc)
-            recv_len = self._sock.recv_into(rc, bufsize)
+            rc = bytearray(bufsize) if buf is None else buf
+            # Bound once, rather than looked up on the socket for every partial read.
+            recv_into = self._sock.recv_into
+            recv_len = recv_into(rc, bufsize)
             to_read = bufsize - recv_len
             if to_read < 0:
                 raise MMQTTException(f"negative number of bytes to read: {to_read}")
             read_timeout = timeout if timeout is not None else self._recv_timeout
-            mv = mv[recv_len:]
+            read_timeout_ms = int(read_timeout * 1000)
+            if to_read > 0:
+                # Only a partial read needs a view to fill in the rest.
+                mv = memoryview(rc)[recv_len:]
             while to_read > 0:
-                recv_len = self._sock.recv_into(mv, to_read)
+                recv_len = recv_into(mv, to_read)
                 to_read -= recv_len
                 mv = mv[recv_len:]
-                if ticks_diff(ticks_ms(), stamp) / 1000 > read_timeout:
+                if ticks_diff(ticks_ms(), stamp) > read_timeout_ms:
                     raise MMQTTException(
                         f"Unable to receive {to_read} bytes within {read_timeout} seconds."
                     )
         else:  # Legacy: fona, esp_atcontrol
             # This will time out with socket timeout (not receive timeout).
-            rc = self._sock.recv(bufsize)
+            recv = self._sock.recv
+            rc = recv(bufsize)
             if not rc:
                 self.logger.debug("_sock_exact_recv timeout")
                 # If no bytes waiting, raise same exception as socketpool
@@ -1114,34 +1302,92 @@ class MQTT:
             to_read = bufsize - len(rc)
             assert to_read >= 0
             read_timeout = self._recv_timeout
+            read_timeout_ms = read_timeout * 1000
+            if to_read > 0:
+                # Copy the chunks into one buffer rather than concatenating them,
+                # which would reallocate the data received so far for every chunk.
+                received = rc
+                rc = bytearray(bufsize)
+                rc[: len(received)] = received
+                mv = memoryview(rc)[len(received) :]
             while to_read > 0:
-                recv = self._sock.recv(to_read)
-                to_read -= len(recv)
-                rc += recv
-                if ticks_diff(ticks_ms(), stamp) / 1000 > read_timeout:
+                data = recv(to_read)
+                mv[: len(data)] = data
+                mv = mv[len(data) :]
+                to_read -= len(data)
+                if ticks_diff(ticks_ms(), stamp) > read_timeout_ms:
                     raise MMQTTException(
                         f"Unable to receive {to_read} bytes within {read_timeout} seconds."
                     )
         return rc
 
-    def _send_str(self, string: str) -> None:
-        """Encodes a string and sends it to a socket.
+    def _buffered_recv(
+        self, bufsize: int, timeout: Optional[float] = None, buf: Optional[bytearray] = None
+    ) -> bytearray:
+        """Reads exactly bufsize bytes like `_sock_exact_recv()`, serving them from the
+        read-ahead buffer. The buffer is refilled with as much as the socket has available,
+        so the one and two byte reads of packet headers do not each cost a system call.
+        Socket timeouts propagate the same way as for unbuffered reads.
 
-        :param str string: String to write to the socket.
+        :param int bufsize: number of bytes to receive
+        :param float timeout: timeout, in seconds. Defaults to recv_timeout
+        :param bytearray buf: optional preallocated buffer of exactly bufsize bytes
+        :return: byte array
+        """
+        stamp = ticks_ms()
+        rc = bytearray(bufsize) if buf is None else buf
+        ahead = self._rx_ahead
+        start = self._rx_start
+        end = self._rx_end
+        got = 0
+        read_timeout = timeout if timeout is not None else self._recv_timeout
+        read_timeout_ms = int(read_timeout * 1000)
+        while True:
+            n = min(end - start, bufsize - got)
+            if n:
+                rc[got : got + n] = ahead[start : start + n]
+                start += n
+                got += n
+            if got == bufsize:
+                break
+            if ticks_diff(ticks_ms(), stamp) > read_timeout_ms:
+                raise MMQTTException(
+                    f"Unable to receive {bufsize - got} bytes within {read_timeout} seconds."
+                )
+            # The buffer is drained, keep it consistent should recv_into() raise.
+            start = end = self._rx_start = self._rx_end = 0
+            if bufsize - got >= len(ahead):
+                # Large payloads are received directly, without copying them twice.
+                got += self._sock.recv_into(memoryview(rc)[got:], bufsize - got)
+            else:
+                end = self._sock.recv_into(ahead, len(ahead))
+        self._rx_start = start
+        self._rx_end = end
+        return rc
+
+    def _valid_publish_topic(self, topic: Union[str, bytes]) -> bytes:
+        """Validates a topic to publish to, which can not contain wildcards.
+        Topics are usually published to over and over, so valid ones are cached.
 
+        :param str|bytes topic: Topic identifier
+        :return: the UTF-8 encoded topic
         """
-        if isinstance(string, str):
-            self._send_bytes(struct.pack("!H", len(string.encode("utf-8"))))
-            self._send_bytes(str.encode(string, "utf-8"))
-        else:
-            self._send_bytes(struct.pack("!H", len(string)))
-            self._send_bytes(string)
+        topic_bytes = self._pub_topics.get(topic)
+        if topic_bytes is None:
+            topic_bytes = self._valid_topic(topic)
+            if b"+" in topic_bytes or b"#" in topic_bytes:
+                raise MMQTTException("Publish topic can not contain wildcards.")
+            if len(self._pub_topics) >= MQTT_TOPIC_CACHE_SZ:
+                self._pub_topics.clear()
+            self._pub_topics[topic] = topic_bytes
+        return topic_bytes
 
     @staticmethod
-    def _valid_topic(topic: str) -> None:
+    def _valid_topic(topic: Union[str, bytes]) -> bytes:
         """Validates if topic provided is proper MQTT topic format.
 
-        :param str topic: Topic identifier
+        :param str|bytes topic: Topic identifier, bytes are taken as already UTF-8 encoded
+        :return: the UTF-8 encoded topic, so that callers need not encode it again
 
         """
         if topic is None:
@@ -1149,9 +1395,14 @@ class MQTT:
         # [MQTT-4.7.3-1]
         if not topic:
             raise MMQTTException("Topic may not be empty.")
+        topic_bytes = topic if isinstance(topic, bytes) else topic.encode("utf-8")
         # [MQTT-4.7.3-3]
-        if len(topic.encode("utf-8")) > MQTT_TOPIC_LENGTH_LIMIT:
+        if len(topic_bytes) > MQTT_TOPIC_LENGTH_LIMIT:
             raise MMQTTException("Topic length is too large.")
+        # [MQTT-1.5.3-2]
+        if b"\x00" in topic_bytes:
+            raise MMQTTException("Topic may not contain null characters.")
+        return topic_bytes
 
     @staticmethod
     def _valid_qos(qos_level: int) -> None:
@@ -1160,11 +1411,9 @@ class MQTT:
         :param int qos_level: Desired QoS level.
 
         """
-        if isinstance(qos_level, int):
-            if qos_level < 0 or qos_level > 2:
-                raise MMQTTException("QoS must be between 1 and 2.")
-        else:
-            raise MMQTTException("QoS must be an integer.")
+        # The type check rejects values that compare equal to a level, such as 1.0.
+        if qos_level not in (0, 1, 2) or not isinstance(qos_level, int):
+            raise MMQTTException("QoS must be an integer between 0 and 2.")
 
     def _connected(self) -> None:
         """Returns MQTT client session status as True if connected, raises
@@ -1177,7 +1426,7 @@ class MQTT:
         """Returns MQTT client session status as True if connected, False
         if not.
         """
-        return self._is_connected and self._sock is not None
+        return self._is_connected
 
     # Logging
     def enable_logger(self, log_pkg, log_level: int = 20, logger_name: str = "log"):
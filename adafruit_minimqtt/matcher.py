@@ -74,6 +74,11 @@ class MQTTMatcher:
                 break
             del parent.children[k]
 
+    def __bool__(self) -> bool:
+        """Return True if any topic filter is stored. Empty branches are
+        pruned on deletion, so this does not need to walk the tree."""
+        return bool(self._root.children)
+
     def iter_match(self, topic: str):
         """Return an iterator on all values associated with filters
         that match the :topic"""
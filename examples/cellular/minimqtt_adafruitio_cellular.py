@@ -32,10 +32,10 @@ fona = FONA(uart, rst)
 ### Feeds ###
 
 # Setup a feed named 'photocell' for publishing to a feed
-photocell_feed = aio_username + "/feeds/photocell"
+photocell_feed = f"{aio_username}/feeds/photocell"
 
 # Setup a feed named 'onoff' for subscribing to changes
-onoff_feed = aio_username + "/feeds/onoff"
+onoff_feed = f"{aio_username}/feeds/onoff"
 
 ### Code ###
 
@@ -44,7 +44,7 @@ onoff_feed = aio_username + "/feeds/onoff"
 def connected(client, userdata, flags, rc):
     # This function will be called when the client is connected
     # successfully to the broker.
-    print("Connected to Adafruit IO! Listening for topic changes on %s" % onoff_feed)
+    print(f"Connected to Adafruit IO! Listening for topic changes on {onoff_feed}")
     # Subscribe to all changes on the onoff_feed.
     client.subscribe(onoff_feed)
 
@@ -99,14 +99,17 @@ mqtt_client.on_message = message
 print("Connecting to Adafruit IO...")
 mqtt_client.connect()
 
+# The photocell feed is published to on every iteration, so validate it once
+publish_photocell = mqtt_client.make_publisher(photocell_feed)
+
 photocell_val = 0
 while True:
-    # Poll the message queue
-    mqtt_client.loop()
+    # Poll the message queue until the next reading is due, rather than sleeping,
+    # so that incoming messages are handled as soon as they arrive.
+    mqtt_client.loop(timeout=5)
 
     # Send a new message
-    print("Sending photocell value: %d..." % photocell_val)
-    mqtt_client.publish(photocell_feed, photocell_val)
+    print(f"Sending photocell value: {photocell_val}...")
+    publish_photocell(photocell_val)
     print("Sent!")
-    photocell_val += 1
-    time.sleep(5)
+    photocell_val = (photocell_val + 1) & 0xFFFF
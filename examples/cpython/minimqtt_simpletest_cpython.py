@@ -21,7 +21,7 @@ mqtt_topic = "test/topic"
 
 # Adafruit IO-style Topic
 # Use this topic if you'd like to connect to io.adafruit.com
-# mqtt_topic = aio_username + "/feeds/temperature"
+# mqtt_topic = f"{aio_username}/feeds/temperature"
 
 
 ### Code ###
@@ -59,13 +59,17 @@ def message(client, topic, message):
     print(f"New message on topic {topic}: {message}")
 
 
+# Loading the CA certificates is costly, so create the context once
+# and let the client reuse it for every (re)connect.
+ssl_context = ssl.create_default_context()
+
 # Set up a MiniMQTT Client
 mqtt_client = MQTT.MQTT(
     broker=os.getenv("broker"),
     username=aio_username,
     password=aio_key,
     socket_pool=socket,
-    ssl_context=ssl.create_default_context(),
+    ssl_context=ssl_context,
 )
 
 # Connect callback handlers to mqtt_client
@@ -76,17 +80,17 @@ mqtt_client.on_unsubscribe = unsubscribe
 mqtt_client.on_publish = publish
 mqtt_client.on_message = message
 
-print("Attempting to connect to %s" % mqtt_client.broker)
+print(f"Attempting to connect to {mqtt_client.broker}")
 mqtt_client.connect()
 
-print("Subscribing to %s" % mqtt_topic)
+print(f"Subscribing to {mqtt_topic}")
 mqtt_client.subscribe(mqtt_topic)
 
-print("Publishing to %s" % mqtt_topic)
+print(f"Publishing to {mqtt_topic}")
 mqtt_client.publish(mqtt_topic, "Hello Broker!")
 
-print("Unsubscribing from %s" % mqtt_topic)
+print(f"Unsubscribing from {mqtt_topic}")
 mqtt_client.unsubscribe(mqtt_topic)
 
-print("Disconnecting from %s" % mqtt_client.broker)
+print(f"Disconnecting from {mqtt_client.broker}")
 mqtt_client.disconnect()
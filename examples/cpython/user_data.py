@@ -10,38 +10,38 @@ import logging
 import socket
 import ssl
 import sys
+from collections import defaultdict
 
 import adafruit_minimqtt.adafruit_minimqtt as MQTT
 
+# Fetched once, rather than by each callback invocation.
+logger = logging.getLogger(__name__)
+# Loading the CA certificates is costly, so the context is created once.
+ssl_context = ssl.create_default_context()
+
 
 def on_connect(mqtt_client, user_data, flags, ret_code):
     """
     connect callback
     """
-    logger = logging.getLogger(__name__)
     logger.debug("Connected to MQTT Broker!")
-    logger.debug(f"Flags: {flags}\n RC: {ret_code}")
+    logger.debug("Flags: %s\n RC: %s", flags, ret_code)
 
 
 def on_subscribe(mqtt_client, user_data, topic, granted_qos):
     """
     subscribe callback
     """
-    logger = logging.getLogger(__name__)
-    logger.debug(f"Subscribed to {topic} with QOS level {granted_qos}")
+    logger.debug("Subscribed to %s with QOS level %s", topic, granted_qos)
 
 
 def on_message(client, topic, message):
     """
     received message callback
     """
-    logger = logging.getLogger(__name__)
-    logger.debug(f"New message on topic {topic}: {message}")
+    logger.debug("New message on topic %s: %s", topic, message)
 
-    messages = client.user_data
-    if not messages.get(topic):
-        messages[topic] = []
-    messages[topic].append(message)
+    client.user_data[topic].append(message)
 
 
 def main():
@@ -50,18 +50,17 @@ def main():
     """
 
     logging.basicConfig()
-    logger = logging.getLogger(__name__)
     logger.setLevel(logging.DEBUG)
 
     # dictionary/map of topic to list of messages
-    messages = {}
+    messages = defaultdict(list)
 
     # connect to MQTT broker
     mqtt = MQTT.MQTT(
         broker="172.40.0.3",
         port=1883,
         socket_pool=socket,
-        ssl_context=ssl.create_default_context(),
+        ssl_context=ssl_context,
         user_data=messages,
     )
 
@@ -75,17 +74,22 @@ def main():
     mqtt.subscribe("foo/#", qos=0)
     mqtt.add_topic_callback("foo/bar", on_message)
 
+    # number of messages already logged, per topic
+    logged = defaultdict(int)
+
     i = 0
     while True:
         i += 1
-        logger.debug(f"Loop {i}")
+        logger.debug("Loop %d", i)
         # Make sure to stay connected to the broker e.g. in case of keep alive.
         mqtt.loop(1)
 
         for topic, msg_list in messages.items():
-            logger.info(f"Got {len(msg_list)} messages from topic {topic}")
-            for msg_cnt, msg in enumerate(msg_list):
-                logger.debug(f"#{msg_cnt}: {msg}")
+            logger.info("Got %d messages from topic %s", len(msg_list), topic)
+            # Only log the messages received since the previous iteration.
+            for msg_cnt in range(logged[topic], len(msg_list)):
+                logger.debug("#%d: %s", msg_cnt, msg_list[msg_cnt])
+            logged[topic] = len(msg_list)
 
 
 if __name__ == "__main__":
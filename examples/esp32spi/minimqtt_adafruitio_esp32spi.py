@@ -2,12 +2,10 @@
 # SPDX-License-Identifier: MIT
 
 import os
-import time
 
 import adafruit_connection_manager
 import board
 import busio
-import neopixel
 from adafruit_esp32spi import adafruit_esp32spi
 from digitalio import DigitalInOut
 
@@ -32,25 +30,16 @@ esp32_reset = DigitalInOut(board.ESP_RESET)
 
 spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
-"""Use below for Most Boards"""
-status_light = neopixel.NeoPixel(board.NEOPIXEL, 1, brightness=0.2)  # Uncomment for Most Boards
-"""Uncomment below for ItsyBitsy M4"""
-# status_light = dotstar.DotStar(board.APA102_SCK, board.APA102_MOSI, 1, brightness=0.2)
-# Uncomment below for an externally defined RGB LED
-# import adafruit_rgbled
-# from adafruit_esp32spi import PWMOut
-# RED_LED = PWMOut.PWMOut(esp, 26)
-# GREEN_LED = PWMOut.PWMOut(esp, 27)
-# BLUE_LED = PWMOut.PWMOut(esp, 25)
-# status_light = adafruit_rgbled.RGBLED(RED_LED, BLUE_LED, GREEN_LED)
 
 ### Feeds ###
 
 # Setup a feed named 'photocell' for publishing to a feed
-photocell_feed = aio_username + "/feeds/photocell"
+photocell_feed = f"{aio_username}/feeds/photocell"
+# Encoded once, as publishing to bytes topics spares encoding them every time
+photocell_feed_bytes = photocell_feed.encode("utf-8")
 
 # Setup a feed named 'onoff' for subscribing to changes
-onoff_feed = aio_username + "/feeds/onoff"
+onoff_feed = f"{aio_username}/feeds/onoff"
 
 ### Code ###
 
@@ -59,9 +48,17 @@ onoff_feed = aio_username + "/feeds/onoff"
 def connected(client, userdata, flags, rc):
     # This function will be called when the client is connected
     # successfully to the broker.
-    print("Connected to Adafruit IO! Listening for topic changes on %s" % onoff_feed)
-    # Subscribe to all changes on the onoff_feed.
-    client.subscribe(onoff_feed)
+    print(f"Connected to Adafruit IO! Listening for topic changes on {onoff_feed}")
+    # Subscribe to all changes on the onoff_feed. Further feeds can be added to the
+    # list as (feed, qos) tuples: they are all subscribed to with a single packet
+    # and acknowledged together, rather than one round trip per subscribe() call.
+    client.subscribe([(onoff_feed, 0)])
+
+
+def subscribed(client, userdata, topic, granted_qos):
+    # This method is called for each topic of the list once the broker
+    # has acknowledged the subscription.
+    print(f"Subscribed to {topic} with QOS level {granted_qos}")
 
 
 def disconnected(client, userdata, rc):
@@ -95,6 +92,7 @@ mqtt_client = MQTT.MQTT(
 # Setup the callback methods above
 mqtt_client.on_connect = connected
 mqtt_client.on_disconnect = disconnected
+mqtt_client.on_subscribe = subscribed
 mqtt_client.on_message = message
 
 # Connect the client to the MQTT broker.
@@ -102,13 +100,27 @@ print("Connecting to Adafruit IO...")
 mqtt_client.connect()
 
 photocell_val = 0
+# Readings are taken every five seconds, staying within the Adafruit IO rate limit,
+# and sent five at a time, which takes a single write to the ESP32 rather than one
+# per reading.
+pending = []
 while True:
-    # Poll the message queue
-    mqtt_client.loop()
-
-    # Send a new message
-    print("Sending photocell value: %d..." % photocell_val)
-    mqtt_client.publish(photocell_feed, photocell_val)
-    print("Sent!")
-    photocell_val += 1
-    time.sleep(5)
+    try:
+        # Poll the message queue until the next reading is due, rather than sleeping,
+        # so that incoming messages are handled as soon as they arrive.
+        mqtt_client.loop(timeout=5)
+
+        pending.append((photocell_feed_bytes, photocell_val))
+        photocell_val = (photocell_val + 1) & 0xFFFF
+        if len(pending) >= 5:
+            # Send the new messages
+            print(f"Sending photocell values: {len(pending)}...")
+            mqtt_client.publish_many(pending)
+            print("Sent!")
+            pending.clear()
+    except (MQTT.MMQTTException, OSError) as e:
+        # Reconnect with the same client, which keeps using the socket pool and
+        # SSL context set up above rather than building everything again.
+        # Unsent readings stay pending and go out with the next batch.
+        print("Lost the connection to Adafruit IO, reconnecting\n", e)
+        mqtt_client.reconnect()
@@ -123,17 +123,17 @@ client.on_subscribe = subscribe
 client.on_unsubscribe = unsubscribe
 client.on_publish = publish
 
-print("Attempting to connect to %s" % client.broker)
+print(f"Attempting to connect to {client.broker}")
 client.connect()
 
-print("Subscribing to %s" % mqtt_topic)
+print(f"Subscribing to {mqtt_topic}")
 client.subscribe(mqtt_topic)
 
-print("Publishing to %s" % mqtt_topic)
+print(f"Publishing to {mqtt_topic}")
 client.publish(mqtt_topic, "Hello Broker!")
 
-print("Unsubscribing from %s" % mqtt_topic)
+print(f"Unsubscribing from {mqtt_topic}")
 client.unsubscribe(mqtt_topic)
 
-print("Disconnecting from %s" % client.broker)
+print(f"Disconnecting from {client.broker}")
 client.disconnect()
@@ -2,12 +2,12 @@
 # SPDX-License-Identifier: MIT
 
 import os
+import random
 import time
 
 import adafruit_connection_manager
 import board
 import busio
-import neopixel
 from adafruit_esp32spi import adafruit_esp32spi
 from digitalio import DigitalInOut
 
@@ -19,6 +19,8 @@ import adafruit_minimqtt.adafruit_minimqtt as MQTT
 
 aio_username = os.getenv("aio_username")
 aio_key = os.getenv("aio_key")
+wifi_ssid = os.getenv("CIRCUITPY_WIFI_SSID")
+wifi_password = os.getenv("CIRCUITPY_WIFI_PASSWORD")
 
 # If you are using a board with pre-defined ESP32 Pins:
 esp32_cs = DigitalInOut(board.ESP_CS)
@@ -32,22 +34,11 @@ esp32_reset = DigitalInOut(board.ESP_RESET)
 
 spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
-"""Use below for Most Boards"""
-status_light = neopixel.NeoPixel(board.NEOPIXEL, 1, brightness=0.2)  # Uncomment for Most Boards
-"""Uncomment below for ItsyBitsy M4"""
-# status_light = dotstar.DotStar(board.APA102_SCK, board.APA102_MOSI, 1, brightness=0.2)
-# Uncomment below for an externally defined RGB LED
-# import adafruit_rgbled
-# from adafruit_esp32spi import PWMOut
-# RED_LED = PWMOut.PWMOut(esp, 26)
-# GREEN_LED = PWMOut.PWMOut(esp, 27)
-# BLUE_LED = PWMOut.PWMOut(esp, 25)
-# status_light = adafruit_rgbled.RGBLED(RED_LED, BLUE_LED, GREEN_LED)
 
 ### Adafruit IO Setup ###
 
 # Setup a feed named `testfeed` for publishing.
-default_topic = aio_username + "/feeds/testfeed"
+default_topic = f"{aio_username}/feeds/testfeed"
 
 ### Code ###
 
@@ -56,7 +47,7 @@ default_topic = aio_username + "/feeds/testfeed"
 def connected(client, userdata, flags, rc):
     # This function will be called when the client is connected
     # successfully to the broker.
-    print("Connected to MQTT broker! Listening for topic changes on %s" % default_topic)
+    print(f"Connected to MQTT broker! Listening for topic changes on {default_topic}")
     # Subscribe to all changes on the default_topic feed.
     client.subscribe(default_topic)
 
@@ -77,7 +68,7 @@ def message(client, topic, message):
 
 # Connect to WiFi
 print("Connecting to WiFi...")
-esp.connect_AP(os.getenv("CIRCUITPY_WIFI_SSID"), os.getenv("CIRCUITPY_WIFI_PASSWORD"))
+esp.connect_AP(wifi_ssid, wifi_password)
 print("Connected!")
 
 pool = adafruit_connection_manager.get_radio_socketpool(esp)
@@ -104,14 +95,20 @@ mqtt_client.connect()
 # Start a blocking message loop...
 # NOTE: NO code below this loop will execute
 # NOTE: Network reconnection is handled within this loop
+# Seconds to wait before reconnecting, doubled after each failure in a row.
+backoff = 0.25
 while True:
     try:
-        mqtt_client.loop()
+        # loop() waits for incoming messages for the whole timeout,
+        # so there is no need to sleep in between the calls.
+        mqtt_client.loop(timeout=1)
+        backoff = 0.25
     except (ValueError, RuntimeError) as e:
         print("Failed to get data, retrying\n", e)
         esp.reset()
-        time.sleep(1)
-        esp.connect_AP(os.getenv("CIRCUITPY_WIFI_SSID"), os.getenv("CIRCUITPY_WIFI_PASSWORD"))
+        # Short waits after a brief network hiccup, longer ones while it persists,
+        # with some jitter to avoid retrying in lockstep with other devices.
+        time.sleep(backoff + random.random() * 0.25)
+        backoff = min(backoff * 2, 5)
+        esp.connect_AP(wifi_ssid, wifi_password)
         mqtt_client.reconnect()
-        continue
-    time.sleep(1)
@@ -47,6 +47,13 @@ status_light = neopixel.NeoPixel(board.NEOPIXEL, 1, brightness=0.2)  # Uncomment
 # status_light = adafruit_rgbled.RGBLED(RED_LED, BLUE_LED, GREEN_LED)
 wifi = adafruit_esp32spi_wifimanager.ESPSPI_WiFiManager(esp, secrets, status_light)
 
+### Topics ###
+
+# Built once and shared by the callback registration and the subscription.
+# Incoming topics are matched as strings, so these stay str rather than bytes.
+battery_topic = f"{secrets['aio_username']}/feeds/device.batterylevel"
+device_group = f"{secrets['aio_username']}/groups/device"
+
 ### Code ###
 
 
@@ -76,7 +83,7 @@ def on_battery_msg(client, topic, message):
     # Method called when device/batteryLife has a new value
     print(f"Battery level: {message}v")
 
-    # client.remove_topic_callback(secrets["aio_username"] + "/feeds/device.batterylevel")
+    # client.remove_topic_callback(battery_topic)
 
 
 def on_message(client, topic, message):
@@ -106,14 +113,14 @@ client.on_disconnect = disconnected
 client.on_subscribe = subscribe
 client.on_unsubscribe = unsubscribe
 client.on_message = on_message
-client.add_topic_callback(secrets["aio_username"] + "/feeds/device.batterylevel", on_battery_msg)
+client.add_topic_callback(battery_topic, on_battery_msg)
 
 # Connect the client to the MQTT broker.
 print("Connecting to MQTT broker...")
 client.connect()
 
 # Subscribe to all notifications on the device group
-client.subscribe(secrets["aio_username"] + "/groups/device", 1)
+client.subscribe(device_group, 1)
 
 # Start a blocking message loop...
 # NOTE: NO code below this loop will execute
@@ -2,12 +2,10 @@
 # SPDX-License-Identifier: MIT
 
 import os
-import time
 
 import adafruit_connection_manager
 import board
 import busio
-import neopixel
 from adafruit_esp32spi import adafruit_esp32spi
 from digitalio import DigitalInOut
 
@@ -32,22 +30,13 @@ esp32_reset = DigitalInOut(board.ESP_RESET)
 
 spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
-"""Use below for Most Boards"""
-status_light = neopixel.NeoPixel(board.NEOPIXEL, 1, brightness=0.2)  # Uncomment for Most Boards
-"""Uncomment below for ItsyBitsy M4"""
-# status_light = dotstar.DotStar(board.APA102_SCK, board.APA102_MOSI, 1, brightness=0.2)
-# Uncomment below for an externally defined RGB LED
-# import adafruit_rgbled
-# from adafruit_esp32spi import PWMOut
-# RED_LED = PWMOut.PWMOut(esp, 26)
-# GREEN_LED = PWMOut.PWMOut(esp, 27)
-# BLUE_LED = PWMOut.PWMOut(esp, 25)
-# status_light = adafruit_rgbled.RGBLED(RED_LED, BLUE_LED, GREEN_LED)
 
 ### Adafruit IO Setup ###
 
 # Setup a feed named `testfeed` for publishing.
-default_topic = aio_username + "/feeds/testfeed"
+default_topic = f"{aio_username}/feeds/testfeed"
+# Encoded once, as publishing to bytes topics spares encoding them every time
+default_topic_bytes = default_topic.encode("utf-8")
 
 
 ### Code ###
@@ -101,11 +90,17 @@ mqtt_client.connect()
 
 photocell_val = 0
 while True:
-    # Poll the message queue
-    mqtt_client.loop()
-
-    # Send a new message
-    print(f"Sending photocell value: {photocell_val}")
-    mqtt_client.publish(default_topic, photocell_val)
-    photocell_val += 1
-    time.sleep(3)
+    try:
+        # Poll the message queue until the next reading is due, rather than sleeping,
+        # so that incoming messages are handled as soon as they arrive.
+        mqtt_client.loop(timeout=3)
+
+        # Send a new message
+        print(f"Sending photocell value: {photocell_val}")
+        mqtt_client.publish(default_topic_bytes, photocell_val)
+        photocell_val = (photocell_val + 1) & 0xFFFF
+    except (MQTT.MMQTTException, OSError) as e:
+        # Reconnect with the same client, which keeps using the socket pool and
+        # SSL context set up above rather than building everything again.
+        print("Lost the connection to the MQTT broker, reconnecting\n", e)
+        mqtt_client.reconnect()
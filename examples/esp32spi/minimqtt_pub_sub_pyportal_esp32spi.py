@@ -2,14 +2,15 @@
 # SPDX-License-Identifier: MIT
 
 import os
-import time
 
 import adafruit_connection_manager
-import adafruit_pyportal
+from adafruit_pyportal.network import Network
 
 import adafruit_minimqtt.adafruit_minimqtt as MQTT
 
-pyportal = adafruit_pyportal.PyPortal()
+# Only the network side of the PyPortal is used, so the display and its
+# framebuffers are not set up.
+network = Network()
 
 # Add settings.toml to your filesystem CIRCUITPY_WIFI_SSID and CIRCUITPY_WIFI_PASSWORD keys
 # with your WiFi credentials. Add your Adafruit IO username and key as well.
@@ -27,7 +28,7 @@ mqtt_topic = "test/topic"
 def connected(client, userdata, flags, rc):
     # This function will be called when the client is connected
     # successfully to the broker.
-    print("Subscribing to %s" % (mqtt_topic))
+    print(f"Subscribing to {mqtt_topic}")
     client.subscribe(mqtt_topic)
 
 
@@ -47,11 +48,11 @@ def message(client, topic, message):
 
 # Connect to WiFi
 print("Connecting to WiFi...")
-pyportal.network.connect()
+network.connect()
 print("Connected!")
 
-pool = adafruit_connection_manager.get_radio_socketpool(pyportal.network._wifi.esp)
-ssl_context = adafruit_connection_manager.get_radio_ssl_context(pyportal.network._wifi.esp)
+pool = adafruit_connection_manager.get_radio_socketpool(network._wifi.esp)
+ssl_context = adafruit_connection_manager.get_radio_ssl_context(network._wifi.esp)
 
 # Set up a MiniMQTT Client
 mqtt_client = MQTT.MQTT(
@@ -72,12 +73,24 @@ mqtt_client.on_message = message
 mqtt_client.connect()
 
 photocell_val = 0
+# Readings are sent eight at a time, which takes a single write to the ESP32
+# and fewer, fuller TCP segments than publishing each reading on its own.
+pending = []
 while True:
-    # Poll the message queue
-    mqtt_client.loop()
-
-    # Send a new message
-    print("Sending photocell value: %d" % photocell_val)
-    mqtt_client.publish(mqtt_topic, photocell_val)
-    photocell_val += 1
-    time.sleep(1)
+    try:
+        # Poll the message queue until the next reading is due, rather than sleeping,
+        # so that incoming messages are handled as soon as they arrive.
+        mqtt_client.loop(timeout=1)
+
+        pending.append((mqtt_topic, photocell_val))
+        photocell_val = (photocell_val + 1) & 0xFFFF
+        if len(pending) >= 8:
+            # Send the new messages
+            print(f"Sending photocell values: {len(pending)}")
+            mqtt_client.publish_many(pending)
+            pending.clear()
+    except (MQTT.MMQTTException, OSError) as e:
+        # Reconnect with the same client, which keeps using the socket pool
+        # set up above rather than building everything again.
+        print("Lost the connection to the MQTT broker, reconnecting\n", e)
+        mqtt_client.reconnect()
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import os
+import time
 
 import adafruit_connection_manager
 import board
@@ -32,12 +33,15 @@ spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
 
 print("Connecting to AP...")
+# Seconds to wait before retrying, doubled after each failure in a row.
+delay = 1
 while not esp.is_connected:
     try:
         esp.connect_AP(os.getenv("ssid"), os.getenv("password"))
     except RuntimeError as e:
         print("could not connect to AP, retrying: ", e)
-        continue
+        time.sleep(delay)
+        delay = min(delay * 2, 30)
 print("Connected to", str(esp.ssid, "utf-8"), "\tRSSI:", esp.rssi)
 
 ### Topic Setup ###
@@ -48,7 +52,7 @@ mqtt_topic = "test/topic"
 
 # Adafruit IO-style Topic
 # Use this topic if you'd like to connect to io.adafruit.com
-# mqtt_topic = aio_username + '/feeds/temperature'
+# mqtt_topic = f"{aio_username}/feeds/temperature"
 
 ### Code ###
 
@@ -107,17 +111,17 @@ mqtt_client.on_unsubscribe = unsubscribe
 mqtt_client.on_publish = publish
 mqtt_client.on_message = message
 
-print("Attempting to connect to %s" % mqtt_client.broker)
+print(f"Attempting to connect to {mqtt_client.broker}")
 mqtt_client.connect()
 
-print("Subscribing to %s" % mqtt_topic)
+print(f"Subscribing to {mqtt_topic}")
 mqtt_client.subscribe(mqtt_topic)
 
-print("Publishing to %s" % mqtt_topic)
+print(f"Publishing to {mqtt_topic}")
 mqtt_client.publish(mqtt_topic, "Hello Broker!")
 
-print("Unsubscribing from %s" % mqtt_topic)
+print(f"Unsubscribing from {mqtt_topic}")
 mqtt_client.unsubscribe(mqtt_topic)
 
-print("Disconnecting from %s" % mqtt_client.broker)
+print(f"Disconnecting from {mqtt_client.broker}")
 mqtt_client.disconnect()
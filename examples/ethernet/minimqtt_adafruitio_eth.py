@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: MIT
 
 import os
-import time
 
 import adafruit_connection_manager
 import board
@@ -27,10 +26,12 @@ eth = WIZNET5K(spi_bus, cs)
 ### Feeds ###
 
 # Setup a feed named 'photocell' for publishing to a feed
-photocell_feed = aio_username + "/feeds/photocell"
+photocell_feed = f"{aio_username}/feeds/photocell"
+# Encoded once, as publishing to bytes topics spares encoding them every time
+photocell_feed_bytes = photocell_feed.encode("utf-8")
 
 # Setup a feed named 'onoff' for subscribing to changes
-onoff_feed = aio_username + "/feeds/onoff"
+onoff_feed = f"{aio_username}/feeds/onoff"
 
 ### Code ###
 
@@ -39,7 +40,7 @@ onoff_feed = aio_username + "/feeds/onoff"
 def connected(client, userdata, flags, rc):
     # This function will be called when the client is connected
     # successfully to the broker.
-    print("Connected to Adafruit IO! Listening for topic changes on %s" % onoff_feed)
+    print(f"Connected to Adafruit IO! Listening for topic changes on {onoff_feed}")
     # Subscribe to all changes on the onoff_feed.
     client.subscribe(onoff_feed)
 
@@ -79,13 +80,26 @@ print("Connecting to Adafruit IO...")
 mqtt_client.connect()
 
 photocell_val = 0
+# Readings are sent four at a time, which takes a single write to the WIZnet
+# chip and fewer TCP segments than publishing each reading on its own.
+pending = []
 while True:
-    # Poll the message queue
-    mqtt_client.loop()
-
-    # Send a new message
-    print("Sending photocell value: %d..." % photocell_val)
-    mqtt_client.publish(photocell_feed, photocell_val)
-    print("Sent!")
-    photocell_val += 1
-    time.sleep(5)
+    try:
+        # Poll the message queue until the next reading is due, rather than sleeping,
+        # so that incoming messages are handled as soon as they arrive.
+        mqtt_client.loop(timeout=5)
+
+        pending.append((photocell_feed_bytes, photocell_val))
+        photocell_val = (photocell_val + 1) & 0xFFFF
+        if len(pending) >= 4:
+            # Send the new messages
+            print(f"Sending photocell values: {len(pending)}...")
+            mqtt_client.publish_many(pending)
+            print("Sent!")
+            pending.clear()
+    except (MQTT.MMQTTException, OSError) as e:
+        # Reconnect with the same client, which keeps using the socket pool and
+        # SSL context set up above rather than building everything again.
+        # Unsent readings stay pending and go out with the next batch.
+        print("Lost the connection to Adafruit IO, reconnecting\n", e)
+        mqtt_client.reconnect()
@@ -3,7 +3,6 @@
 
 import os
 import ssl
-import time
 
 import socketpool
 import wifi
@@ -20,13 +19,16 @@ import adafruit_minimqtt.adafruit_minimqtt as MQTT
 aio_username = os.getenv("aio_username")
 aio_key = os.getenv("aio_key")
 
-print(f"Connecting to {os.getenv('CIRCUITPY_WIFI_SSID')}")
-wifi.radio.connect(os.getenv("CIRCUITPY_WIFI_SSID"), os.getenv("CIRCUITPY_WIFI_PASSWORD"))
-print(f"Connected to {os.getenv('CIRCUITPY_WIFI_SSID')}!")
+wifi_ssid = os.getenv("CIRCUITPY_WIFI_SSID")
+print(f"Connecting to {wifi_ssid}")
+wifi.radio.connect(wifi_ssid, os.getenv("CIRCUITPY_WIFI_PASSWORD"))
+print(f"Connected to {wifi_ssid}!")
 ### Feeds ###
 
 # Setup a feed named 'photocell' for publishing to a feed
 photocell_feed = "photocell"
+# Encoded once, as publishing to bytes topics spares encoding them every time
+photocell_feed_bytes = photocell_feed.encode("utf-8")
 
 # Setup a feed named 'onoff' for subscribing to changes
 onoff_feed = "onoff"
@@ -87,12 +89,12 @@ mqtt_client.connect()
 
 photocell_val = 0
 while True:
-    # Poll the message queue
-    mqtt_client.loop(timeout=1)
+    # Poll the message queue until the next reading is due, rather than sleeping,
+    # so that incoming messages are handled as soon as they arrive.
+    mqtt_client.loop(timeout=5)
 
     # Send a new message
     print(f"Sending photocell value: {photocell_val}...")
-    mqtt_client.publish(photocell_feed, photocell_val)
+    mqtt_client.publish(photocell_feed_bytes, photocell_val)
     print("Sent!")
-    photocell_val += 1
-    time.sleep(5)
+    photocell_val = (photocell_val + 1) & 0xFFFF
@@ -20,14 +20,15 @@ import adafruit_minimqtt.adafruit_minimqtt as MQTT
 aio_username = os.getenv("aio_username")
 aio_key = os.getenv("aio_key")
 
-print("Connecting to %s" % os.getenv("CIRCUITPY_WIFI_SSID"))
-wifi.radio.connect(os.getenv("CIRCUITPY_WIFI_SSID"), os.getenv("CIRCUITPY_WIFI_PASSWORD"))
-print("Connected to %s!" % os.getenv("CIRCUITPY_WIFI_SSID"))
+wifi_ssid = os.getenv("CIRCUITPY_WIFI_SSID")
+print(f"Connecting to {wifi_ssid}")
+wifi.radio.connect(wifi_ssid, os.getenv("CIRCUITPY_WIFI_PASSWORD"))
+print(f"Connected to {wifi_ssid}!")
 
 ### Adafruit IO Setup ###
 
 # Setup a feed named `testfeed` for publishing.
-default_topic = aio_username + "/feeds/testfeed"
+default_topic = f"{aio_username}/feeds/testfeed"
 
 
 ### Code ###
@@ -20,9 +20,10 @@ import adafruit_minimqtt.adafruit_minimqtt as MQTT
 aio_username = os.getenv("aio_username")
 aio_key = os.getenv("aio_key")
 
-print("Connecting to %s" % os.getenv("CIRCUITPY_WIFI_SSID"))
-wifi.radio.connect(os.getenv("CIRCUITPY_WIFI_SSID"), os.getenv("CIRCUITPY_WIFI_PASSWORD"))
-print("Connected to %s!" % os.getenv("CIRCUITPY_WIFI_SSID"))
+wifi_ssid = os.getenv("CIRCUITPY_WIFI_SSID")
+print(f"Connecting to {wifi_ssid}")
+wifi.radio.connect(wifi_ssid, os.getenv("CIRCUITPY_WIFI_PASSWORD"))
+print(f"Connected to {wifi_ssid}!")
 
 ### Code ###
 
@@ -53,7 +54,7 @@ def on_battery_msg(client, topic, message):
     # Method called when device/batteryLife has a new value
     print(f"Battery level: {message}v")
 
-    # client.remove_topic_callback(aio_username + "/feeds/device.batterylevel")
+    # client.remove_topic_callback(f"{aio_username}/feeds/device.batterylevel")
 
 
 def on_message(client, topic, message):
@@ -89,14 +90,14 @@ client.on_disconnect = disconnected
 client.on_subscribe = subscribe
 client.on_unsubscribe = unsubscribe
 client.on_message = on_message
-client.add_topic_callback(aio_username + "/feeds/device.batterylevel", on_battery_msg)
+client.add_topic_callback(f"{aio_username}/feeds/device.batterylevel", on_battery_msg)
 
 # Connect the client to the MQTT broker.
 print("Connecting to MQTT broker...")
 client.connect()
 
 # Subscribe to all notifications on the device group
-client.subscribe(aio_username + "/groups/device", 1)
+client.subscribe(f"{aio_username}/groups/device", 1)
 
 # Start a blocking message loop...
 # NOTE: NO code below this loop will execute
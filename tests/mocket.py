@@ -36,6 +36,6 @@ class Mocket:
         if size == 0:
             return size
         chop = self._to_send[0:size]
-        retbuf[0:] = chop
+        retbuf[0:size] = chop
         self._to_send = self._to_send[size:]
         return size
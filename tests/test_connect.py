@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: 2024 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+"""connect tests"""
+
+import logging
+import socket
+import ssl
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from mocket import Mocket
+
+import adafruit_minimqtt.adafruit_minimqtt as MQTT
+
+CONNACK = bytearray([0x20, 0x02, 0x00, 0x00])
+
+testdata = [
+    # client ID only
+    (
+        {},
+        None,
+        bytearray(
+            [
+                0x10,  # fixed header
+                0x0F,  # remaining length
+                0x00,
+                0x04,
+                0x4D,  # protocol name "MQTT"
+                0x51,
+                0x54,
+                0x54,
+                0x04,  # protocol level
+                0x02,  # connect flags: clean session
+                0x00,
+                0x3C,  # keep alive
+                0x00,
+                0x03,  # client ID length
+                0x63,  # client ID "cid"
+                0x69,
+                0x64,
+            ]
+        ),
+    ),
+    # non-ASCII client ID, the length is in bytes, not characters
+    (
+        {"client_id": "cïd"},
+        None,
+        bytearray([0x10, 0x10, 0x00, 0x04, 0x4D, 0x51, 0x54, 0x54, 0x04, 0x02, 0x00, 0x3C])
+        + bytearray([0x00, 0x04, 0x63, 0xC3, 0xAF, 0x64]),
+    ),
+    # username and password
+    (
+        {"username": "usr", "password": "pw"},
+        None,
+        bytearray([0x10, 0x18, 0x00, 0x04, 0x4D, 0x51, 0x54, 0x54, 0x04, 0xC2, 0x00, 0x3C])
+        + bytearray([0x00, 0x03, 0x63, 0x69, 0x64])  # client ID
+        + bytearray([0x00, 0x03, 0x75, 0x73, 0x72])  # username
+        + bytearray([0x00, 0x02, 0x70, 0x77]),  # password
+    ),
+    # username without a password sets only the username flag
+    (
+        {"username": "usr"},
+        None,
+        bytearray([0x10, 0x14, 0x00, 0x04, 0x4D, 0x51, 0x54, 0x54, 0x04, 0x82, 0x00, 0x3C])
+        + bytearray([0x00, 0x03, 0x63, 0x69, 0x64])  # client ID
+        + bytearray([0x00, 0x03, 0x75, 0x73, 0x72]),  # username
+    ),
+    # last will, QoS 1, retained
+    (
+        {},
+        ("t/w", "bye", True, 1),
+        bytearray([0x10, 0x19, 0x00, 0x04, 0x4D, 0x51, 0x54, 0x54, 0x04, 0x2E, 0x00, 0x3C])
+        + bytearray([0x00, 0x03, 0x63, 0x69, 0x64])  # client ID
+        + bytearray([0x00, 0x03, 0x74, 0x2F, 0x77])  # will topic
+        + bytearray([0x00, 0x03, 0x62, 0x79, 0x65]),  # will message
+    ),
+    # last will with an already encoded topic
+    (
+        {},
+        (b"t/w", "bye", True, 1),
+        bytearray([0x10, 0x19, 0x00, 0x04, 0x4D, 0x51, 0x54, 0x54, 0x04, 0x2E, 0x00, 0x3C])
+        + bytearray([0x00, 0x03, 0x63, 0x69, 0x64])  # client ID
+        + bytearray([0x00, 0x03, 0x74, 0x2F, 0x77])  # will topic
+        + bytearray([0x00, 0x03, 0x62, 0x79, 0x65]),  # will message
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "kwargs,will,exp_recv",
+    testdata,
+    ids=[
+        "client_id",
+        "client_id_non_ascii",
+        "username_password",
+        "username_only",
+        "will",
+        "will_bytes_topic",
+    ],
+)
+def test_connect(kwargs, will, exp_recv) -> None:
+    """
+    Protocol level testing of CONNECT packet encoding and CONNACK handling.
+
+    Nothing will travel over the wire, it is all fake.
+    """
+    logging.basicConfig()
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.DEBUG)
+
+    kwargs.setdefault("client_id", "cid")
+    mqtt_client = MQTT.MQTT(
+        broker="localhost",
+        port=1883,
+        ssl_context=ssl.create_default_context(),
+        connect_retries=1,
+        **kwargs,
+    )
+    mqtt_client.logger = logger
+    if will:
+        mqtt_client.will_set(*will)
+
+    mocket = Mocket(CONNACK)
+    with patch.object(mqtt_client._connection_manager, "get_socket", return_value=mocket):
+        assert mqtt_client.connect() == 0
+
+    assert mqtt_client.is_connected()
+    assert mocket.sent == exp_recv
+    assert len(mocket._to_send) == 0
+
+
+@pytest.mark.parametrize(
+    "connack,session_present",
+    [(bytearray([0x20, 0x02, 0x00, 0x00]), 0), (bytearray([0x20, 0x02, 0x01, 0x00]), 1)],
+    ids=["clean", "session_present"],
+)
+def test_connect_session_present(connack, session_present) -> None:
+    """connect() returns the session present flag from CONNACK."""
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+    mocket = Mocket(connack)
+    with patch.object(mqtt_client._connection_manager, "get_socket", return_value=mocket):
+        assert mqtt_client.connect(clean_session=False) == session_present
+
+
+def test_connect_refused() -> None:
+    """A non-zero CONNACK return code is raised with the code attached."""
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+    mocket = Mocket(bytearray([0x20, 0x02, 0x00, 0x05]))
+    connection_manager = mqtt_client._connection_manager
+    with patch.object(connection_manager, "get_socket", return_value=mocket), patch.object(
+        connection_manager, "close_socket"
+    ):
+        with pytest.raises(MQTT.MMQTTException) as context:
+            mqtt_client.connect()
+
+    assert context.value.code == 5
+    assert not mqtt_client.is_connected()
+
+
+def test_connect_nodelay() -> None:
+    """Nagle's algorithm is disabled on sockets of pools that support it."""
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, socket_pool=socket, connect_retries=1)
+    mocket = Mocket(CONNACK)
+    mocket.setsockopt = Mock()
+    with patch.object(mqtt_client._connection_manager, "get_socket", return_value=mocket):
+        mqtt_client.connect()
+
+    mocket.setsockopt.assert_called_once_with(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def test_connect_nodelay_unsupported() -> None:
+    """Pools lacking either socket option constant are left alone."""
+    pool = SimpleNamespace(TCP_NODELAY=socket.TCP_NODELAY)
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, socket_pool=pool, connect_retries=1)
+    mocket = Mocket(CONNACK)
+    mocket.setsockopt = Mock()
+    with patch.object(mqtt_client._connection_manager, "get_socket", return_value=mocket):
+        mqtt_client.connect()
+
+    mocket.setsockopt.assert_not_called()
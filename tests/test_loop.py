@@ -13,6 +13,7 @@ from unittest import mock
 from unittest.mock import patch
 
 import pytest
+from mocket import Mocket
 
 import adafruit_minimqtt.adafruit_minimqtt as MQTT
 
@@ -88,7 +89,7 @@ class Pingtet:
             if size == 0:
                 return size
             chop = self._to_send[0:size]
-            retbuf[0:] = chop
+            retbuf[0:size] = chop
             self._to_send = self._to_send[size:]
             if len(self._to_send) == 0:
                 self._got_pingreq = False
@@ -248,3 +249,121 @@ class TestLoop:
 
         # This means no other messages than the PUBLISH messages generated by the code above.
         assert len(mocket.sent) == i * (2 + 2 + len(topic) + len(message))
+
+    def test_loop_read_ahead(self):
+        """
+        With CPython sockets, packets are parsed from a read-ahead buffer
+        rather than with a recv_into() call for every field.
+        """
+        mqtt_client = MQTT.MQTT(
+            broker="localhost",
+            port=1883,
+            socket_pool=socket,
+            ssl_context=ssl.create_default_context(),
+            connect_retries=1,
+        )
+        received = []
+        mqtt_client.on_message = lambda client, topic, msg: received.append((topic, msg))
+
+        publish = bytearray([0x30, 0x08, 0x00, 0x03, 0x66, 0x6F, 0x6F]) + b"bar"
+        mocket = Mocket(bytearray([0x20, 0x02, 0x00, 0x00]) + publish + publish)
+        mocket.recv_into = mock.Mock(wraps=mocket.recv_into)
+        with patch.object(mqtt_client._connection_manager, "get_socket", return_value=mocket):
+            mqtt_client.connect()
+
+        mqtt_client._wait_for_msg()
+        mqtt_client._wait_for_msg()
+
+        assert received == [("foo", "bar"), ("foo", "bar")]
+        assert mocket.recv_into.call_count == 1
+        assert len(mocket._to_send) == 0
+
+    def test_loop_qos2_not_dispatched(self):
+        """
+        Incoming QoS 2 messages raise before reaching on_message, and the
+        connection stays usable for the next packet.
+        """
+        mqtt_client = MQTT.MQTT(
+            broker="localhost",
+            port=1883,
+            socket_pool=socket,
+            ssl_context=ssl.create_default_context(),
+            connect_retries=1,
+        )
+        received = []
+        mqtt_client.on_message = lambda client, topic, msg: received.append((topic, msg))
+
+        publish_qos2 = bytearray([0x34, 0x0A, 0x00, 0x03, 0x66, 0x6F, 0x6F, 0x00, 0x01]) + b"baz"
+        publish = bytearray([0x30, 0x08, 0x00, 0x03, 0x66, 0x6F, 0x6F]) + b"bar"
+        mocket = Mocket(bytearray([0x20, 0x02, 0x00, 0x00]) + publish_qos2 + publish)
+        with patch.object(mqtt_client._connection_manager, "get_socket", return_value=mocket):
+            mqtt_client.connect()
+        sent = len(mocket.sent)
+
+        with pytest.raises(MQTT.MMQTTException, match="Level 2"):
+            mqtt_client._wait_for_msg()
+        assert not received
+
+        mqtt_client._wait_for_msg()
+
+        assert received == [("foo", "bar")]
+        # No PUBREC went out for the QoS 2 message.
+        assert len(mocket.sent) == sent
+        assert len(mocket._to_send) == 0
+
+    @pytest.mark.parametrize("recv_buffer_size", [0, 4])
+    def test_loop_read_ahead_size(self, recv_buffer_size):
+        """
+        Packets are received whole with a read-ahead buffer smaller than them,
+        as well as with reading ahead disabled.
+        """
+        mqtt_client = MQTT.MQTT(
+            broker="localhost",
+            port=1883,
+            socket_pool=socket,
+            ssl_context=ssl.create_default_context(),
+            connect_retries=1,
+            recv_buffer_size=recv_buffer_size,
+        )
+        received = []
+        mqtt_client.on_message = lambda client, topic, msg: received.append((topic, msg))
+
+        publish = bytearray([0x30, 0x08, 0x00, 0x03, 0x66, 0x6F, 0x6F]) + b"bar"
+        mocket = Mocket(bytearray([0x20, 0x02, 0x00, 0x00]) + publish + publish)
+        with patch.object(mqtt_client._connection_manager, "get_socket", return_value=mocket):
+            mqtt_client.connect()
+
+        mqtt_client._wait_for_msg()
+        mqtt_client._wait_for_msg()
+
+        assert received == [("foo", "bar"), ("foo", "bar")]
+        assert (mqtt_client._rx_ahead is None) == (recv_buffer_size == 0)
+        assert len(mocket._to_send) == 0
+
+
+@pytest.mark.parametrize(
+    "encoded,length",
+    [
+        (b"\x00", 0),
+        (b"\x7f", 127),
+        (b"\x80\x01", 128),
+        (b"\xff\x7f", 16383),
+        (b"\x80\x80\x01", 16384),
+        (b"\xff\xff\xff\x7f", MQTT.MQTT_MSG_MAX_SZ),
+    ],
+)
+def test_decode_remaining_length(encoded, length):
+    """Remaining length takes one to four bytes [2.2.3]."""
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+    mqtt_client._sock = Mocket(bytearray(encoded))
+
+    assert mqtt_client._decode_remaining_length() == length
+
+
+def test_decode_remaining_length_invalid():
+    """More than four bytes of remaining length are rejected."""
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+    mqtt_client._sock = Mocket(bytearray(b"\xff\xff\xff\xff\x01"))
+
+    with pytest.raises(MQTT.MMQTTException, match="invalid remaining length"):
+        mqtt_client._decode_remaining_length()
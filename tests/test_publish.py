@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: 2024 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+"""publish tests"""
+
+import logging
+import ssl
+from unittest import mock
+from unittest.mock import patch
+
+import pytest
+from mocket import Mocket
+
+import adafruit_minimqtt.adafruit_minimqtt as MQTT
+
+
+def handle_publish(client, user_data, topic, pid):
+    """
+    Record topics and packet identifiers into user data.
+    """
+    user_data.append((topic, pid))
+
+
+testdata = [
+    # QoS 0, string topic and message
+    (
+        ("foo/bar", "baz"),
+        {},
+        bytearray(),
+        bytearray(
+            [
+                0x30,  # fixed header
+                0x0C,  # remaining length
+                0x00,
+                0x07,  # topic length
+                0x66,  # topic
+                0x6F,
+                0x6F,
+                0x2F,
+                0x62,
+                0x61,
+                0x72,
+                0x62,  # message
+                0x61,
+                0x7A,
+            ]
+        ),
+    ),
+    # pre-encoded topic yields the same packet
+    (
+        (b"foo/bar", "baz"),
+        {},
+        bytearray(),
+        bytearray([0x30, 0x0C, 0x00, 0x07, 0x66, 0x6F, 0x6F, 0x2F, 0x62, 0x61, 0x72])
+        + bytearray([0x62, 0x61, 0x7A]),
+    ),
+    # integer message, retained
+    (
+        ("foo/bar", 42),
+        {"retain": True},
+        bytearray(),
+        bytearray([0x31, 0x0B, 0x00, 0x07, 0x66, 0x6F, 0x6F, 0x2F, 0x62, 0x61, 0x72])
+        + bytearray([0x34, 0x32]),
+    ),
+    # QoS 1 waits for the PUBACK with the matching packet identifier
+    (
+        ("foo/bar", "baz"),
+        {"qos": 1},
+        bytearray([0x40, 0x02, 0x00, 0x01]),  # PUBACK
+        bytearray([0x32, 0x0E, 0x00, 0x07, 0x66, 0x6F, 0x6F, 0x2F, 0x62, 0x61, 0x72])
+        + bytearray([0x00, 0x01])  # packet identifier
+        + bytearray([0x62, 0x61, 0x7A]),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "args,kwargs,to_send,exp_recv",
+    testdata,
+    ids=["qos0", "bytes_topic", "int_retain", "qos1"],
+)
+def test_publish(args, kwargs, to_send, exp_recv) -> None:
+    """
+    Protocol level testing of PUBLISH packet encoding and PUBACK handling.
+
+    Nothing will travel over the wire, it is all fake.
+    """
+    logging.basicConfig()
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.DEBUG)
+
+    published = []
+    mqtt_client = MQTT.MQTT(
+        broker="localhost",
+        port=1883,
+        ssl_context=ssl.create_default_context(),
+        connect_retries=1,
+        user_data=published,
+    )
+    mqtt_client.on_publish = handle_publish
+
+    # patch is_connected() to avoid CONNECT/CONNACK handling.
+    mqtt_client.is_connected = lambda: True
+    mocket = Mocket(to_send)
+    mqtt_client._sock = mocket
+
+    mqtt_client.logger = logger
+
+    mqtt_client.publish(*args, **kwargs)
+
+    assert published == [(args[0], 1 if kwargs.get("qos") else 0)]
+    assert mocket.sent == exp_recv
+    assert len(mocket._to_send) == 0
+
+
+def test_publish_wildcard() -> None:
+    """Topics with wildcards are rejected whether passed as str or bytes."""
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+    mqtt_client.is_connected = lambda: True
+    mqtt_client._sock = Mocket(bytearray())
+
+    for topic in ("foo/+", "foo/#", b"foo/+", b"foo/#"):
+        with pytest.raises(MQTT.MMQTTException, match="wildcards"):
+            mqtt_client.publish(topic, "baz")
+
+
+def test_publish_null_character() -> None:
+    """Topics with U+0000 are rejected [MQTT-1.5.3-2]."""
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+    mqtt_client.is_connected = lambda: True
+    mqtt_client._sock = Mocket(bytearray())
+
+    for topic in ("foo\0bar", b"foo\0bar"):
+        with pytest.raises(MQTT.MMQTTException, match="null"):
+            mqtt_client.publish(topic, "baz")
+
+
+def test_make_publisher() -> None:
+    """The function returned by make_publisher() sends the same packets as publish()."""
+    published = []
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1, user_data=published)
+    mqtt_client.on_publish = handle_publish
+    mqtt_client.is_connected = lambda: True
+    mocket = Mocket(bytearray())
+    mqtt_client._sock = mocket
+
+    publisher = mqtt_client.make_publisher("foo/bar")
+    publisher("baz")
+    publisher(42)
+
+    assert published == [("foo/bar", 0), ("foo/bar", 0)]
+    assert mocket.sent == (
+        bytearray([0x30, 0x0C, 0x00, 0x07, 0x66, 0x6F, 0x6F, 0x2F, 0x62, 0x61, 0x72])
+        + bytearray([0x62, 0x61, 0x7A])
+        + bytearray([0x30, 0x0B, 0x00, 0x07, 0x66, 0x6F, 0x6F, 0x2F, 0x62, 0x61, 0x72])
+        + bytearray([0x34, 0x32])
+    )
+
+    with pytest.raises(MQTT.MMQTTException, match="wildcards"):
+        mqtt_client.make_publisher("foo/#")
+
+
+def test_publish_topic_cache() -> None:
+    """Publish topics are validated once, with a bounded number of them remembered."""
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+    mqtt_client.is_connected = lambda: True
+    mocket = Mocket(bytearray())
+    mqtt_client._sock = mocket
+
+    with patch.object(mqtt_client, "_valid_topic", wraps=mqtt_client._valid_topic) as valid:
+        mqtt_client.publish("foo/bar", "baz")
+        mqtt_client.publish("foo/bar", "baz")
+        assert valid.call_count == 1
+
+        for i in range(2 * MQTT.MQTT_TOPIC_CACHE_SZ):
+            mqtt_client.publish(f"foo/{i}", "baz")
+        assert len(mqtt_client._pub_topics) <= MQTT.MQTT_TOPIC_CACHE_SZ
+
+    assert mocket.sent.startswith(
+        bytearray([0x30, 0x0C, 0x00, 0x07, 0x66, 0x6F, 0x6F, 0x2F, 0x62, 0x61, 0x72])
+        + bytearray([0x62, 0x61, 0x7A])
+        + bytearray([0x30, 0x0C, 0x00, 0x07, 0x66, 0x6F, 0x6F, 0x2F, 0x62, 0x61, 0x72])
+    )
+
+
+def test_will_set_topic() -> None:
+    """The last will topic is validated without taking a publish topic cache slot."""
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+
+    mqtt_client.will_set("foo/bar", "bye")
+    assert not mqtt_client._pub_topics
+
+    with pytest.raises(MQTT.MMQTTException, match="wildcards"):
+        mqtt_client.will_set("foo/#", "bye")
+
+
+def test_publish_many() -> None:
+    """publish_many() sends all the PUBLISH packets with a single send."""
+    published = []
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1, user_data=published)
+    mqtt_client.on_publish = handle_publish
+    mqtt_client.is_connected = lambda: True
+    mocket = Mocket(bytearray())
+    mocket.send = mock.Mock(wraps=mocket.send)
+    mqtt_client._sock = mocket
+
+    mqtt_client.publish_many([("foo/bar", "baz"), ("foo/bar", 42)])
+
+    assert published == [("foo/bar", 0), ("foo/bar", 0)]
+    assert mocket.sent == (
+        bytearray([0x30, 0x0C, 0x00, 0x07, 0x66, 0x6F, 0x6F, 0x2F, 0x62, 0x61, 0x72])
+        + bytearray([0x62, 0x61, 0x7A])
+        + bytearray([0x30, 0x0B, 0x00, 0x07, 0x66, 0x6F, 0x6F, 0x2F, 0x62, 0x61, 0x72])
+        + bytearray([0x34, 0x32])
+    )
+    assert mocket.send.call_count == 1
+
+    # Nothing is sent if any of the messages is invalid.
+    with pytest.raises(MQTT.MMQTTException, match="wildcards"):
+        mqtt_client.publish_many([("foo/bar", "baz"), ("foo/#", "baz")])
+    assert mocket.send.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "msg_len,remaining_length,sends",
+    [(3, bytearray([0x0C]), 1), (MQTT.MQTT_TX_PKT_SZ, bytearray([0x89, 0x04]), 2)],
+)
+def test_publish_send_count(msg_len, remaining_length, sends) -> None:
+    """Small PUBLISH packets are sent with a single send, large ones with two."""
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+    mqtt_client.is_connected = lambda: True
+    mocket = Mocket(bytearray())
+    mocket.send = mock.Mock(wraps=mocket.send)
+    mqtt_client._sock = mocket
+
+    msg = b"x" * msg_len
+    mqtt_client.publish("foo/bar", msg)
+    mqtt_client.publish("foo/bar", msg)
+
+    packet = bytearray([0x30]) + remaining_length + b"\x00\x07foo/bar" + msg
+    assert mocket.sent == packet + packet
+    assert mocket.send.call_count == 2 * sends
@@ -6,6 +6,7 @@
 
 import logging
 import ssl
+from unittest import mock
 
 import pytest
 from mocket import Mocket
@@ -209,6 +210,7 @@ def test_subscribe(topic, to_send, exp_recv) -> None:
     # patch is_connected() to avoid CONNECT/CONNACK handling.
     mqtt_client.is_connected = lambda: True
     mocket = Mocket(to_send)
+    mocket.send = mock.Mock(wraps=mocket.send)
     mqtt_client._sock = mocket
 
     mqtt_client.logger = logger
@@ -222,4 +224,48 @@ def test_subscribe(topic, to_send, exp_recv) -> None:
         for topic_name, _ in topic:
             assert topic_name in subscribed_topics
     assert mocket.sent == exp_recv
+    # The whole SUBSCRIBE packet is sent at once, whatever the number of topics.
+    assert mocket.send.call_count == 1
     assert len(mocket._to_send) == 0
+
+
+@pytest.mark.parametrize(
+    "topic,match",
+    [
+        (None, "NoneType"),
+        ((None, 0), "NoneType"),
+        (42, "int"),
+        (b"foo/bar", "bytes"),
+        ((b"foo/bar", 0), "bytes"),
+        ([("foo/bar", 0), (b"foo/baz", 0)], "bytes"),
+        ("", "empty"),
+        (("foo/bar", 2), "Level 2"),
+        ([("foo/bar", 0), ("foo/baz", 2)], "Level 2"),
+    ],
+    ids=[
+        "none",
+        "none_tuple",
+        "int",
+        "bytes",
+        "bytes_tuple",
+        "bytes_in_list",
+        "empty",
+        "qos2",
+        "qos2_in_list",
+    ],
+)
+def test_subscribe_invalid_topic(topic, match) -> None:
+    """
+    Invalid topics and QoS 2 are rejected with MMQTTException before anything is sent.
+    """
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+
+    # patch is_connected() to avoid CONNECT/CONNACK handling.
+    mqtt_client.is_connected = lambda: True
+    mocket = Mocket(bytearray())
+    mqtt_client._sock = mocket
+
+    with pytest.raises(MQTT.MMQTTException, match=match):
+        mqtt_client.subscribe(topic)
+    assert mocket.sent == bytearray()
+    assert not mqtt_client._subscribed_topics
@@ -6,6 +6,7 @@
 
 import logging
 import ssl
+from unittest import mock
 
 import pytest
 from mocket import Mocket
@@ -68,6 +69,49 @@ testdata = [
             + [0x6F] * 257
         ),
     ),
+    # UNSUBSCRIBE responded to by PUBLISH followed by UNSUBACK
+    (
+        "foo/bar",
+        bytearray(
+            [
+                0x30,  # PUBLISH
+                0x0C,
+                0x00,
+                0x07,
+                0x66,
+                0x6F,
+                0x6F,
+                0x2F,
+                0x62,
+                0x61,
+                0x72,
+                0x66,
+                0x6F,
+                0x6F,
+                0xB0,  # UNSUBACK
+                0x02,
+                0x00,
+                0x01,
+            ]
+        ),
+        bytearray(
+            [
+                0xA2,  # fixed header
+                0x0B,  # remaining length
+                0x00,  # message ID
+                0x01,
+                0x00,  # topic length
+                0x07,
+                0x66,  # topic
+                0x6F,
+                0x6F,
+                0x2F,
+                0x62,
+                0x61,
+                0x72,
+            ]
+        ),
+    ),
     # use list of topics for more coverage. If the range was (1, 10000), that would be
     # long enough to use 3 bytes for remaining length, however that would make the test
     # run for many minutes even on modern systems, so 1000 is used instead.
@@ -95,7 +139,7 @@ testdata = [
 @pytest.mark.parametrize(
     "topic,to_send,exp_recv",
     testdata,
-    ids=["short_topic", "long_topic", "topic_list_long"],
+    ids=["short_topic", "long_topic", "publish_first", "topic_list_long"],
 )
 def test_unsubscribe(topic, to_send, exp_recv) -> None:
     """
@@ -125,6 +169,7 @@ def test_unsubscribe(topic, to_send, exp_recv) -> None:
     # patch is_connected() to avoid CONNECT/CONNACK handling.
     mqtt_client.is_connected = lambda: True
     mocket = Mocket(to_send)
+    mocket.send = mock.Mock(wraps=mocket.send)
     mqtt_client._sock = mocket
 
     mqtt_client.logger = logger
@@ -143,4 +188,33 @@ def test_unsubscribe(topic, to_send, exp_recv) -> None:
         for topic_name in topic:
             assert topic_name in unsubscribed_topics
     assert mocket.sent == exp_recv
+    # The whole UNSUBSCRIBE packet is sent at once, whatever the number of topics.
+    assert mocket.send.call_count == 1
     assert len(mocket._to_send) == 0
+
+
+@pytest.mark.parametrize(
+    "topic,match",
+    [
+        (None, "NoneType"),
+        (42, "int"),
+        (b"foo/bar", "bytes"),
+        (["foo/bar", b"foo/baz"], "bytes"),
+    ],
+    ids=["none", "int", "bytes", "bytes_in_list"],
+)
+def test_unsubscribe_invalid_topic(topic, match) -> None:
+    """
+    Invalid topics are rejected with MMQTTException before anything is sent.
+    """
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, connect_retries=1)
+
+    # patch is_connected() to avoid CONNECT/CONNACK handling.
+    mqtt_client.is_connected = lambda: True
+    mocket = Mocket(bytearray())
+    mqtt_client._sock = mocket
+    mqtt_client._subscribed_topics = ["foo/bar"]
+
+    with pytest.raises(MQTT.MMQTTException, match=match):
+        mqtt_client.unsubscribe(topic)
+    assert mocket.sent == bytearray()